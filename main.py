@@ -84,12 +84,14 @@ def graceful_exit(
     rigctld: Optional[Any] = None,
     exit_code: int = 0,
     show_banner: bool = True,
+    rf2ks: Optional[RF2KSClient] = None,
 ) -> None:
     """
     Cleanly shut down resources and exit the program.
 
     - Stop rigctld if we started it.
     - Ask radio client to shutdown(restore=...) if available, else disconnect().
+    - Close the RF2K-S HTTP session.
     - Print a nice farewell banner.
     - Exit process with exit_code.
     """
@@ -116,6 +118,16 @@ def graceful_exit(
         except Exception:
             pass
 
+    # 2b) Release pooled amplifier HTTP connections
+    try:
+        if rf2ks:
+            rf2ks.close()
+    except Exception as e:
+        try:
+            logger and logger.debug(f"RF2K-S close raised: {e}")
+        except Exception:
+            pass
+
     # 3) Friendly goodbye
     if show_banner:
         print("\n" + "=" * 80)
@@ -663,7 +675,7 @@ def main() -> None:
 
     finally:
         # Always clean up, restore state and exit nicely
-        graceful_exit(radio_client=radio_client, restore=restore, rigctld=rigctld)
+        graceful_exit(radio_client=radio_client, restore=restore, rigctld=rigctld, rf2ks=rf2ks)
 
 
 if __name__ == "__main__":
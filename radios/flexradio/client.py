@@ -4,7 +4,7 @@ from typing import Optional, Dict, Any
 from loghandler import get_logger
 from radio_interface import BaseRadioClient, BaseRadioError
 
-from .transport import FlexTransport
+from .transport import FlexTransport, parse_ack_rc
 from .parser import FlexParser
 
 
@@ -343,12 +343,7 @@ class FlexRadioClient(BaseRadioClient):
             resp = self.transport.send_command(command)
         except TimeoutError as e:
             raise FlexRadioError(str(e)) from e
-        # Parse rc
-        rc = None
-        try:
-            rc = int(resp.split("|", 2)[1])
-        except Exception:
-            pass
+        rc = parse_ack_rc(resp)
         if rc not in (0, None):
             raise FlexRadioError(f"Command '{command}' failed rc={rc}")
         return resp
@@ -1,6 +1,19 @@
 # radios/flexradio/parser.py
-import re
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional
+
+# Substrings that must be present for any parser to care about a line.
+# Most SmartSDR status traffic (meters, gps, client, ...) contains none of them.
+_TRIGGERS = ("slice ", "interlock", "transmit", "nickname=", "callsign=")
+
+
+def _fields(rest: str) -> Dict[str, str]:
+    """Split 'k1=v1 k2=v2 flag' into {'k1': 'v1', 'k2': 'v2'} (bare tokens are ignored)."""
+    out: Dict[str, str] = {}
+    for tok in rest.split():
+        key, sep, val = tok.partition("=")
+        if sep:
+            out[key] = val
+    return out
 
 
 class FlexParser:
@@ -8,16 +21,17 @@ class FlexParser:
     Minimal line parser for SmartSDR 'H' / 'S' messages.
 
     It detects and dispatches:
-      - Identity: 'H...' or any line containing 'radio nickname=... callsign=...'
+      - Identity: '...|radio nickname=... callsign=...' (or any segment carrying those fields)
       - Slice updates: '...|slice <id> ... RF_frequency=... mode=... tx=...'
       - Interlock/PTT: '...|interlock state=READY|TRANSMITTING|...'
       - Transmit power: '...|transmit rfpower=.. tunepower=..'
 
     Design choice:
-      Instead of pre-filtering with brittle substring checks in feed(),
-      we call all parsers on every line. Each parser quickly returns if
-      its regex does not match. This avoids issues with small formatting
-      differences (e.g., '|' immediately before keywords).
+      SmartSDR status lines are '|'-separated segments of the form
+      '<keyword> [id] key=value key=value ...'. feed() walks the line once:
+      it splits on '|', takes the leading keyword of each segment and looks
+      up its parser in a dict. Each parser receives the rest of the segment
+      and reads its fields with plain str.split/partition (no regex scans).
     """
 
     def __init__(
@@ -32,94 +46,93 @@ class FlexParser:
         self._on_interlock = on_interlock
         self._on_transmit = on_transmit
 
+        # Segment keyword -> parser(rest_of_segment)
+        self._dispatch: Dict[str, Callable[[str], None]] = {
+            "radio": self._parse_identity,
+            "slice": self._parse_slice,
+            "interlock": self._parse_interlock,
+            "transmit": self._parse_transmit,
+        }
+
     # Public entry point
     def feed(self, line: str):
-        if not line:
+        if not line or not any(t in line for t in _TRIGGERS):
             return
-        # Try all parsers; each is a no-op if it doesn't match.
-        self._parse_identity(line)
-        self._parse_slice(line)
-        self._parse_interlock(line)
-        self._parse_transmit(line)
+        dispatch = self._dispatch
+        for seg in line.split("|"):
+            keyword, _, rest = seg.partition(" ")
+            handler = dispatch.get(keyword)
+            if handler is not None:
+                handler(rest)
+            elif "nickname=" in rest or "callsign=" in rest:
+                # Some firmwares carry identity on other segments; still pick up the fields.
+                self._parse_identity(rest)
 
     # ----------- Parsers -----------
 
-    def _parse_identity(self, line: str):
+    def _parse_identity(self, rest: str):
         """
-        Matches identity lines:
-          - 'H1|radio nickname=RemoteQTH callsign=SA6TUT'
-          - Some firmwares emit identity as an 'S' line; we still look for the fields.
+        Matches identity segments:
+          - 'S1|radio nickname=RemoteQTH callsign=SA6TUT'
         """
-        if not (line.startswith("H") or " radio " in line or "nickname=" in line or "callsign=" in line):
+        if not ("nickname=" in rest or "callsign=" in rest):
             return
-
-        nick = None
-        call = None
-
-        m1 = re.search(r"\bnickname=([^\s]+)", line)
-        if m1:
-            nick = m1.group(1)
-        m2 = re.search(r"\bcallsign=([^\s]+)", line)
-        if m2:
-            call = m2.group(1)
-
+        f = _fields(rest)
+        nick = f.get("nickname")
+        call = f.get("callsign")
         if self._on_identity and (nick or call):
             self._on_identity(nick or "", call or "")
 
-    def _parse_slice(self, line: str):
+    def _parse_slice(self, rest: str):
         """
         Matches slice updates like:
           'S...|slice 0 ... RF_frequency=7.090000 mode=LSB tx=1 ...'
         """
-        m_id = re.search(r"\bslice\s+(\d+)\b", line)
-        if not m_id:
+        sid_tok, _, rest = rest.lstrip().partition(" ")
+        if not sid_tok.isdigit():
             return
-        sid = int(m_id.group(1))
+        sid = int(sid_tok)
+        f = _fields(rest)
         data = {}
 
         # Frequency can be 'RF_frequency' (MHz) or occasionally 'freq'
-        mf = re.search(r"\bRF_frequency=([0-9.]+)", line)
-        if not mf:
-            mf = re.search(r"\bfreq=([0-9.]+)", line)
-        if mf:
+        fv = f.get("RF_frequency") or f.get("freq")
+        if fv:
             try:
-                data["freq_mhz"] = float(mf.group(1))
+                data["freq_mhz"] = float(fv)
             except ValueError:
                 pass
 
-        mm = re.search(r"\bmode=([A-Za-z0-9]+)", line)
-        if mm:
-            data["mode"] = mm.group(1)
+        mode = f.get("mode")
+        if mode and mode.isalnum():
+            data["mode"] = mode
 
-        mt = re.search(r"\btx=([01])\b", line)
-        if mt:
-            data["tx"] = int(mt.group(1))
+        tx = f.get("tx")
+        if tx in ("0", "1"):
+            data["tx"] = int(tx)
 
         if self._on_slice:
             self._on_slice(sid, data)
 
-    def _parse_interlock(self, line: str):
+    def _parse_interlock(self, rest: str):
         """
-        Matches interlock/PTT state lines like:
+        Matches interlock/PTT state segments like:
           'S...|interlock state=READY'
           'S...|interlock state=TRANSMITTING'
         """
-        if "interlock" not in line:
-            return
-        ms = re.search(r"\bstate=([A-Z_]+)", line)
-        if ms and self._on_interlock:
-            self._on_interlock(ms.group(1))
+        state = _fields(rest).get("state")
+        if state and self._on_interlock:
+            self._on_interlock(state)
 
-    def _parse_transmit(self, line: str):
+    def _parse_transmit(self, rest: str):
         """
-        Matches transmit power lines like:
+        Matches transmit power segments like:
           'S...|transmit rfpower=13 tunepower=13'
         """
-        if "transmit" not in line:
-            return
-        mr = re.search(r"\brfpower=([0-9]+)", line)
-        mt = re.search(r"\btunepower=([0-9]+)", line)
-        rf = int(mr.group(1)) if mr else None
-        tp = int(mt.group(1)) if mt else None
+        f = _fields(rest)
+        rv = f.get("rfpower")
+        tv = f.get("tunepower")
+        rf = int(rv) if rv and rv.isdigit() else None
+        tp = int(tv) if tv and tv.isdigit() else None
         if self._on_transmit and (rf is not None or tp is not None):
             self._on_transmit(rf, tp)
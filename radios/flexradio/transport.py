@@ -1,10 +1,28 @@
+import select
+import selectors
 import socket
 import threading
 import time
-import queue
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict, List, Tuple
 
 from loghandler import get_logger
+from radios.netutil import apply_tcp_options
+
+# Upper bound for the encoded-command cache (distinct command strings).
+_CMD_CACHE_MAX = 256
+# recv() size, and the most bytes gathered into one dispatch batch.
+_RECV_SIZE = 65536
+_MAX_BATCH = 4 * _RECV_SIZE
+
+
+def parse_ack_rc(resp: str) -> Optional[int]:
+    """Return the rc of an 'R<seq>|<rc>|...' ACK line, or None if it has none."""
+    _, _, rest = resp.partition("|")
+    rc_str, _, _ = rest.partition("|")
+    try:
+        return int(rc_str)
+    except ValueError:
+        return None
 
 
 class FlexTransport:
@@ -13,8 +31,10 @@ class FlexTransport:
 
     Responsibilities:
       - Open/close the TCP socket with low-latency options.
-      - Background listener that reads '\n'-terminated lines.
-      - Delivers 'R...' ACK lines to an internal queue for send_command().
+      - Background listener that reads '\n'-terminated lines. It blocks in a
+        selector on the socket plus a wakeup socketpair, so it is idle (no
+        periodic timeouts) until data arrives or disconnect() pokes it.
+      - Routes 'R<seq>|...' ACK lines to the send_command() waiting on that seq.
       - Delivers all lines (R/H/S/...) to a user callback for parsing/state.
       - Measures ACK round-trip time and logs it in a consistent format.
 
@@ -36,7 +56,7 @@ class FlexTransport:
         self.host = host
         self.port = int(port)
         self.connect_timeout = float(connect_timeout)
-        self.recv_timeout = float(recv_timeout)
+        self.recv_timeout = float(recv_timeout)  # unused since the listener is selector-driven; kept for API compat
         self.ack_timeout = float(ack_timeout)
         self.debug = debug
 
@@ -48,15 +68,24 @@ class FlexTransport:
         self._seq = 1
         self._seq_lock = threading.Lock()
 
-        self._resp_q: "queue.Queue[str]" = queue.Queue(maxsize=512)
-        self._buffer = b""
+        # Outstanding commands: seq -> (event, [ack line]); set by the listener.
+        self._pending: Dict[int, Tuple[threading.Event, List[str]]] = {}
+        self._pending_lock = threading.Lock()
+        self._buffer = bytearray()
 
         self._listener: Optional[threading.Thread] = None
         self._stop_evt = threading.Event()
+        # Readiness wait for the listener: radio socket + self-pipe for stop requests
+        self._sel: Optional[selectors.BaseSelector] = None
+        self._wake_r: Optional[socket.socket] = None
+        self._wake_w: Optional[socket.socket] = None
 
         # Called for every received line (including 'R...' ACKs)
         self._line_cb = line_callback
 
+        # command str -> utf-8 bytes; repeated mode/tune/power commands skip re-encoding
+        self._cmd_bytes_cache: Dict[str, bytes] = {}
+
     # ---------- Public properties ----------
 
     @property
@@ -65,27 +94,10 @@ class FlexTransport:
 
     # ---------- TCP setup ----------
 
-    def _apply_tcp_options(self, s: socket.socket):
-        """Best-effort low-latency + keepalive socket options."""
-        try:
-            s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-        except OSError:
-            pass
-        try:
-            s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
-        except OSError:
-            pass
-        for opt, val in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3)):
-            if hasattr(socket, opt):
-                try:
-                    s.setsockopt(socket.IPPROTO_TCP, getattr(socket, opt), val)
-                except OSError:
-                    pass
-
     def connect(self):
         """Open the socket, start the listener thread."""
         s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self._apply_tcp_options(s)
+        apply_tcp_options(s)
         s.settimeout(self.connect_timeout)
         try:
             s.connect((self.host, self.port))
@@ -98,8 +110,15 @@ class FlexTransport:
             self._logger.error(f"[NET] Connect error to {self.host}:{self.port}: {e}")
             raise
 
-        # Shorter read timeout for responsive listener.
-        s.settimeout(self.recv_timeout)
+        # Reads are driven by the selector; the timeout only bounds sendall().
+        s.settimeout(self.ack_timeout)
+        wake_r, wake_w = socket.socketpair()
+        wake_r.setblocking(False)
+        sel = selectors.DefaultSelector()
+        sel.register(s, selectors.EVENT_READ)
+        sel.register(wake_r, selectors.EVENT_READ)
+        self._sel, self._wake_r, self._wake_w = sel, wake_r, wake_w
+
         with self._sock_lock:
             self._sock = s
         self._connected = True
@@ -111,6 +130,7 @@ class FlexTransport:
     def disconnect(self):
         """Stop the listener and close the socket."""
         self._stop_evt.set()
+        self._wakeup()
         if self._listener and self._listener.is_alive():
             self._listener.join(timeout=1.0)
 
@@ -128,70 +148,114 @@ class FlexTransport:
 
     close = disconnect
 
+    def _wakeup(self):
+        """Unblock the listener's selector (best-effort; it may already be gone)."""
+        w = self._wake_w
+        if w is not None:
+            try:
+                w.send(b"\0")
+            except OSError:
+                pass
+
     # ---------- Line I/O ----------
 
-    def _recv_line(self) -> str:
+    def _recv_lines(self) -> List[str]:
         """
-        Receive one line (without trailing newline). Does not hold the
-        socket lock while blocking — avoids artificial command latency.
+        Receive all complete lines currently available (without trailing
+        newlines). Blocks until at least one line is complete, then returns
+        the whole batch so the listener dispatches once per recv() instead
+        of once per line. Does not hold the socket lock while blocking —
+        avoids artificial command latency. Returns [] when asked to stop.
         """
-        start = time.time()
-        while b"\n" not in self._buffer:
+        idx = self._buffer.rfind(b"\n")
+        while idx < 0:
             if self._stop_evt.is_set():
-                return ""
-            # Soft guard to avoid infinite waits if server goes silent.
-            if time.time() - start > 10:
-                raise socket.timeout("Timeout receiving data")
-
+                return []
             s = self._sock
-            if s is None:
-                return ""
-            try:
-                chunk = s.recv(4096)
-            except socket.timeout:
+            sel = self._sel
+            if s is None or sel is None:
+                return []
+
+            # Block until the radio sends data or disconnect() pokes the wakeup socket.
+            ready = sel.select()
+            if self._stop_evt.is_set():
+                return []
+            if not any(key.fileobj is s for key, _ in ready):
                 continue
+            try:
+                chunk = s.recv(_RECV_SIZE)
+                if not chunk:
+                    raise ConnectionError("Socket closed by peer")
+                self._buffer.extend(chunk)
+                # Drain whatever else has already arrived (zero-timeout select)
+                # so one batch covers a burst instead of one recv per wakeup.
+                while len(self._buffer) < _MAX_BATCH and select.select([s], [], [], 0)[0]:
+                    more = s.recv(_RECV_SIZE)
+                    if not more:
+                        break  # EOF; reported by the next recv()
+                    self._buffer.extend(more)
+            except ConnectionError:
+                raise
             except OSError as e:
                 raise OSError(f"Socket recv failed: {e}") from e
 
-            if not chunk:
-                raise ConnectionError("Socket closed by peer")
-            self._buffer += chunk
+            idx = self._buffer.rfind(b"\n")
+
+        # Peel every complete line; keep the partial tail for the next call.
+        # The API is pure ASCII: decode the whole batch once with the ASCII codec.
+        block = self._buffer[:idx].decode("ascii", "replace")
+        del self._buffer[:idx + 1]
+        return [line.strip() for line in block.split("\n")]
+
+    def _dispatch_line(self, line: str):
+        """Route one line: ACKs to their waiting sender, every line to the callback."""
+        if self.debug:
+            self._logger.debug("[RECV] %s", line)
 
-        line, self._buffer = self._buffer.split(b"\n", 1)
-        return line.decode(errors="replace").strip()
+        # ACKs always go to their pending slot (plus optional callback)
+        if line.startswith("R"):
+            self._route_ack(line)
+
+        if self._line_cb:
+            try:
+                self._line_cb(line)
+            except Exception as e:
+                # Parser bugs should not kill the network loop.
+                self._logger.error(f"[PARSER] callback failed: {e}")
+
+    def _route_ack(self, line: str):
+        """Hand an 'R<seq>|...' line to the send_command() waiting on <seq>."""
+        # The seq is parsed once here; senders never compare prefixes themselves.
+        bar = line.find("|")
+        try:
+            seq = int(line[1:bar] if bar > 0 else line[1:])
+        except ValueError:
+            return
+        with self._pending_lock:
+            slot = self._pending.get(seq)
+        if slot is None:
+            if self.debug:
+                self._logger.debug("[ACK] no pending command for seq=%d: '%s'", seq, line)
+            return
+        evt, box = slot
+        box.append(line)
+        evt.set()
 
     def _listener_loop(self):
-        """Read lines and dispatch: ACKs to queue, all lines to callback."""
+        """Read batches of lines and dispatch each: ACKs to senders, all lines to callback."""
         try:
             while not self._stop_evt.is_set():
                 try:
-                    line = self._recv_line()
-                except socket.timeout:
-                    continue
-                except Exception as e:
+                    lines = self._recv_lines()
+                except OSError as e:
+                    # Includes ConnectionError (peer closed) and recv failures.
                     if not self._stop_evt.is_set():
                         self._logger.error(f"[NET] Listener error: {e}. Closing connection.")
                     break
 
-                if not line:
-                    continue
-
-                if self.debug:
-                    self._logger.debug(f"[RECV] {line}")
-
-                # ACKs always go to response queue (plus optional callback)
-                if line.startswith("R"):
-                    try:
-                        self._resp_q.put_nowait(line)
-                    except queue.Full:
-                        self._logger.warning("[NET] response_queue full; dropping ACK")
-
-                if self._line_cb:
-                    try:
-                        self._line_cb(line)
-                    except Exception as e:
-                        # Parser bugs should not kill the network loop.
-                        self._logger.error(f"[PARSER] callback failed: {e}")
+                for line in lines:
+                    if line:
+                        self._dispatch_line(line)
 
         finally:
             with self._sock_lock:
@@ -203,6 +267,13 @@ class FlexTransport:
                     self._sock.close()
                 self._sock = None
                 self._connected = False
+            for res in (self._sel, self._wake_r, self._wake_w):
+                if res is not None:
+                    try:
+                        res.close()
+                    except OSError:
+                        pass
+            self._sel = self._wake_r = self._wake_w = None
 
     # ---------- Commands/ACKs ----------
 
@@ -229,52 +300,56 @@ class FlexTransport:
             raise ConnectionError("Transport is not connected")
 
         seq = self._next_seq()
-        full = f"C{seq}|{command}\n"
-        t0 = time.time()
+        body = self._cmd_bytes_cache.get(command)
+        if body is None:
+            body = command.encode()
+            if len(self._cmd_bytes_cache) >= _CMD_CACHE_MAX:
+                self._cmd_bytes_cache.clear()
+            self._cmd_bytes_cache[command] = body
+        # Build the wire bytes before taking the socket lock.
+        payload = b"C%d|%s\n" % (seq, body)
+
+        # Register the ACK slot before sending so a fast reply cannot be missed.
+        evt = threading.Event()
+        box: List[str] = []
+        with self._pending_lock:
+            self._pending[seq] = (evt, box)
 
-        # Send (protect with socket lock)
         try:
-            with self._sock_lock:
-                s = self._sock
-                if not s:
-                    raise ConnectionError("Socket is closed")
-                if self.debug:
-                    self._logger.debug(f"[SEND] {full.strip()}")
-                s.sendall(full.encode())
-        except Exception as e:
-            self._logger.error(f"[NET] Failed to send command '{command}': {e}")
-            raise
+            t0 = time.monotonic_ns()
 
-        # Wait for matching ACK
-        timeout = self.ack_timeout if ack_timeout is None else float(ack_timeout)
-        deadline = t0 + timeout
-        while time.time() < deadline:
+            # Send (protect with socket lock)
             try:
-                resp = self._resp_q.get(timeout=0.1)
-            except queue.Empty:
-                continue
+                with self._sock_lock:
+                    s = self._sock
+                    if not s:
+                        raise ConnectionError("Socket is closed")
+                    if self.debug:
+                        self._logger.debug("[SEND] C%d|%s", seq, command)
+                    s.sendall(payload)
+            except OSError as e:
+                self._logger.error(f"[NET] Failed to send command '{command}': {e}")
+                raise
 
-            if resp.startswith(f"R{seq}|"):
-                ack_ms = int((time.time() - t0) * 1000)
-                # Parse rc if present
-                rc = None
-                try:
-                    rc = int(resp.split("|", 2)[1])
-                except Exception:
-                    pass
+            # Wait for matching ACK
+            timeout = self.ack_timeout if ack_timeout is None else float(ack_timeout)
+            if evt.wait(timeout) and box:
+                resp = box[0]
+                ack_ms = (time.monotonic_ns() - t0) // 1_000_000
+                rc = parse_ack_rc(resp)
 
                 if log_ack and rc is not None:
                     if rc == 0:
-                        self._logger.debug(f"[ACK] rc=0 in {ack_ms} ms  cmd='{command}'")
+                        self._logger.debug("[ACK] rc=0 in %d ms  cmd='%s'", ack_ms, command)
                     else:
-                        msg = f"[ACK] rc={rc} in {ack_ms} ms  cmd='{command}'  resp='{resp}'"
-                        if warn_on_nonzero:
-                            self._logger.warning(msg)
-                        else:
-                            self._logger.debug(msg)
+                        log = self._logger.warning if warn_on_nonzero else self._logger.debug
+                        log("[ACK] rc=%d in %d ms  cmd='%s'  resp='%s'", rc, ack_ms, command, resp)
                 return resp
+        finally:
+            with self._pending_lock:
+                self._pending.pop(seq, None)
 
-        waited_ms = int((time.time() - t0) * 1000)
+        waited_ms = (time.monotonic_ns() - t0) // 1_000_000
         self._logger.error(
             f"[ACK] Timeout after {waited_ms} ms waiting for ACK of cmd='{command}'. "
             f"(ack_timeout={timeout:.1f}s)"
@@ -0,0 +1,27 @@
+# radios/netutil.py
+# Small socket helpers shared by the radio backends.
+
+import socket
+
+
+def apply_tcp_options(s: socket.socket) -> None:
+    """Best-effort low-latency + keepalive socket options."""
+    try:
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except OSError:
+        pass
+    try:
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    except OSError:
+        pass
+    try:
+        # Room for bursts of status lines between listener wakeups.
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 256 * 1024)
+    except OSError:
+        pass
+    for opt, val in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3)):
+        if hasattr(socket, opt):
+            try:
+                s.setsockopt(socket.IPPROTO_TCP, getattr(socket, opt), val)
+            except OSError:
+                pass
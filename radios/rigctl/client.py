@@ -1,16 +1,32 @@
 # rigctl_client.py (a.k.a. your rigctl section in client.py)
-import os
+import select
 import socket
-import telnetlib
 import threading
 import time
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from radio_interface import BaseRadioClient, BaseRadioError
 from loghandler import get_logger
+from radios.netutil import apply_tcp_options
 
 logger = None
 
+# Reply classifiers for str.startswith (tuple form; no per-call upper()).
+_RPRT = ("RPRT", "rprt")
+_RPRT_B = (b"RPRT", b"rprt")
+_RPRT_UNSUPPORTED = ("RPRT -11", "rprt -11")
+_RPRT_UNSUPPORTED_B = (b"RPRT -11", b"rprt -11")
+
+
+def _fmt_triplet(hz: int) -> str:
+    """Format 5354800 Hz as '5.354.800' (MHz.KHz.Hz)."""
+    mhz = hz // 1_000_000
+    rem = hz % 1_000_000
+    khz = rem // 1_000
+    h   = rem % 1_000
+    return f"{mhz}.{khz:03d}.{h:03d}"
+
+
 class RigctlError(BaseRadioError):
     """Custom exception for RigctlClient-related errors."""
     pass
@@ -21,10 +37,13 @@ class RigctlClient(BaseRadioClient):
     Hamlib rigctl network client with optional event-driven PTT.
 
     Design:
-      - Transport: raw TCP on Windows (more reliable than telnetlib), telnetlib otherwise.
+      - Transport: raw TCP socket with a persistent line buffer on all platforms
+        (rigctld speaks plain text; no telnet option negotiation is needed).
       - A lightweight background thread polls 't' at a modest interval and updates
-        an internal PTT state machine guarded by a Condition. It enables event-driven
-        waits (wait_for_tx/unkey) without busy-waiting in the main loop.
+        an internal PTT state machine that sets TX-started/TX-stopped Events on edges.
+        Between polls it sleeps in select() on the socket, so stray output or a peer
+        close is seen right away. It enables event-driven waits (wait_for_tx/unkey)
+        without busy-waiting.
       - If rig/rigctld returns 'RPRT -11' for 't', we mark ptt_supported=False and
         stop the event thread so the app can switch to MANUAL mode.
       - On transient comm errors the thread attempts one reconnect. If that fails,
@@ -35,6 +54,14 @@ class RigctlClient(BaseRadioClient):
     supports_event_ptt: bool = False
     ptt_supported: bool = True  # may be flipped to False on RPRT -11
 
+    # Pre-encoded wire form of the PTT poll (sent 10-20x per second)
+    _CMD_T = b"t\n"
+
+    # Idle backoff: after this many consecutive RX polls, stretch the RX poll
+    # interval by 1.5x per poll up to the cap; any PTT edge snaps it back.
+    _BACKOFF_AFTER = 20
+    _POLL_IDLE_MAX = 0.5
+
     def __init__(
         self,
         host: str = "localhost",
@@ -51,14 +78,17 @@ class RigctlClient(BaseRadioClient):
         self.label = label
         self.debug = bool(debug)
 
-        # transport selection
-        self._use_socket = (os.name == "nt")  # default to raw TCP on Windows
+        # transport
         self._sock: Optional[socket.socket] = None
-        self._sock_buf: bytes = b""
-        self.conn: Optional[telnetlib.Telnet] = None
+        # Received-but-unconsumed bytes, plus a reusable recv_into() scratch area
+        self._sock_buf = bytearray()
+        self._rx = bytearray(8192)
+        self._rx_view = memoryview(self._rx)
 
         self.connected = False
-        self.lock = threading.RLock()
+        # Serializes one request/reply exchange on the socket (rigctld is strictly
+        # request/reply). Plain Lock: nothing re-enters it; see _reconnect_locked().
+        self._io_lock = threading.Lock()
 
         # cached snapshot
         self.mode: Optional[str] = None
@@ -66,15 +96,18 @@ class RigctlClient(BaseRadioClient):
         self.freq_hz: Optional[int] = None
 
         # --- Event PTT machinery ---
-        # Condition protecting PTT booleans + edge notifications
-        self._ptt_cond = threading.Condition()
+        # PTT state: only the monitor thread writes it. One Event per level, flipped
+        # on edges, so waiters block in a single Event.wait() (no lock/predicate loop).
         self._ptt_active = False
-        self._ptt_last = False  # for edge detection
+        self._tx_started = threading.Event()
+        self._tx_stopped = threading.Event()
+        self._tx_stopped.set()
         self._evt_thread: Optional[threading.Thread] = None
         self._evt_stop = threading.Event()
         # Poll cadence is conservative to avoid overloading rigctld
-        self._poll_idle_s = 0.10   # while RX (no TX)
+        self._poll_idle_s = 0.10   # while RX (no TX), before backoff
         self._poll_tx_s = 0.05     # while TX (a bit faster for snappy unkey)
+        self._rx_streak = 0        # consecutive RX polls since the last edge
         self._reconnect_once = True  # single automatic reconnect attempt
 
     # ---------------------------------------------------------------------
@@ -93,13 +126,7 @@ class RigctlClient(BaseRadioClient):
     def _connect(self, timeout: float = 5.0):
         """Open connection to rigctld and take an initial snapshot."""
         try:
-            if self._use_socket:
-                self._sock = socket.create_connection((self.host, self.port), timeout=timeout)
-                self._sock.settimeout(3.0)
-                self._sock_buf = b""
-            else:
-                self.conn = telnetlib.Telnet(self.host, self.port, timeout=timeout)
-                self.conn.timeout = 2.0
+            self._open_socket(timeout)
             self.connected = True
             logger.info(f"Connected to rigctld at {self.host}:{self.port}")
         except Exception as e:
@@ -135,12 +162,13 @@ class RigctlClient(BaseRadioClient):
         One-shot PTT read (used by POLLING fallback).
         Marks ptt_supported=False if 'RPRT -11' is observed.
         """
-        resp = self._send("t", quiet=False, expect_value=True).strip()
+        if self.debug:
+            logger.debug("[rigctl] > t")
+        resp = self._send_bytes(self._CMD_T, quiet=False, expect_value=True).strip()
         if resp == "":
             return False
 
-        r = resp.upper()
-        if r.startswith("RPRT -11"):
+        if resp.startswith(_RPRT_UNSUPPORTED):
             if self.ptt_supported:
                 logger.debug("[PTT] Rig/rigctld does not support reading PTT (RPRT -11).")
             self.ptt_supported = False
@@ -158,25 +186,11 @@ class RigctlClient(BaseRadioClient):
 
     def wait_for_tx(self, timeout: float = 90.0) -> bool:
         """Block until TX asserted or timeout. Returns True if TX started."""
-        deadline = time.time() + max(0.0, timeout)
-        with self._ptt_cond:
-            while time.time() < deadline:
-                if self._ptt_active:
-                    return True
-                left = deadline - time.time()
-                self._ptt_cond.wait(timeout=min(0.25, max(0.0, left)))
-            return self._ptt_active
+        return self._tx_started.wait(max(0.0, timeout))
 
     def wait_for_unkey(self, timeout: float = 300.0) -> bool:
         """Block until TX deasserted or timeout. Returns True if TX stopped."""
-        deadline = time.time() + max(0.0, timeout)
-        with self._ptt_cond:
-            while time.time() < deadline:
-                if not self._ptt_active:
-                    return True
-                left = deadline - time.time()
-                self._ptt_cond.wait(timeout=min(0.25, max(0.0, left)))
-            return not self._ptt_active
+        return self._tx_stopped.wait(max(0.0, timeout))
 
     def disconnect(self):
         self.shutdown(restore=False)
@@ -185,21 +199,14 @@ class RigctlClient(BaseRadioClient):
         """Stop monitor thread and close transports."""
         self._stop_ptt_monitor()
 
-        with self.lock:
-            if self._sock:
-                try:
-                    self._sock.close()
-                except Exception:
-                    pass
-                self._sock = None
-                self._sock_buf = b""
-            if self.conn:
-                try:
-                    self.conn.close()
-                except Exception:
-                    pass
-                self.conn = None
+        # Don't hang shutdown behind a stuck exchange; closing the socket unblocks it.
+        locked = self._io_lock.acquire(timeout=3.0)
+        try:
+            self._close_socket()
             self.connected = False
+        finally:
+            if locked:
+                self._io_lock.release()
         logger.info("Disconnected from rigctld")
 
     def set_drive_power(self, rfpower: int):
@@ -214,202 +221,264 @@ class RigctlClient(BaseRadioClient):
         Lightweight rigctl snapshot of mode/width/frequency.
         Logs a single concise line for visibility.
         """
-        mode, width = self._get_mode()
+        # Both queries go out in one write; rigctld answers them in order.
+        mode_values, freq_values = self._query_many(("+m", "+f"))
+
+        mode, width = self._parse_mode(mode_values)
         if mode:
             self.mode = mode
         if width is not None:
             self.width = width
 
-        freq_hz = self._get_freq()
+        freq_hz = self._parse_freq(freq_values)
         if freq_hz is not None:
             self.freq_hz = freq_hz
 
-        def fmt_triplet(hz: int) -> str:
-            mhz = hz // 1_000_000
-            rem = hz % 1_000_000
-            khz = rem // 1_000
-            h   = rem % 1_000
-            return f"{mhz}.{khz:03d}.{h:03d}"
-
         parts = ["[SNAPSHOT]"]
         parts.append(f"mode={self.mode}" if self.mode else "mode=unknown")
         if self.width is not None:
             parts.append(f"width={self.width}Hz")
         if self.freq_hz is not None:
-            parts.append(f"freq={fmt_triplet(self.freq_hz)}")
+            parts.append(f"freq={_fmt_triplet(self.freq_hz)}")
         logger.info(" ".join(parts))
 
-    def _get_mode(self) -> Tuple[Optional[str], Optional[int]]:
-        resp = self._send("m", expect_value=True).strip()
-        parts = resp.split()
-        mode = parts[0].upper() if parts else None
+    def _parse_mode(self, values: Dict[str, str]) -> Tuple[Optional[str], Optional[int]]:
+        mode = values.get("Mode")
+        mode = mode.upper() if mode else None
         width: Optional[int] = None
-
-        if len(parts) >= 2:
-            try:
-                width = int(parts[1])
-            except ValueError:
-                width = None
-        else:
-            # try read the next line for width
-            try:
-                if self._use_socket:
-                    extra = self._readline_socket(timeout=0.5)
-                else:
-                    extra = self.conn.read_until(b"\n", timeout=0.5) if self.conn else b""
-                s = extra.decode(errors="replace").strip() if extra else ""
-                if s and not s.upper().startswith("RPRT"):
-                    try:
-                        width = int(s.split()[0])
-                    except ValueError:
-                        pass
-            except Exception:
-                pass
+        try:
+            width = int(values["Passband"])
+        except (KeyError, ValueError):
+            pass
 
         if mode is None and self.debug:
-            logger.debug(f"[GET MODE] unexpected: '{resp}'")
+            logger.debug(f"[GET MODE] unexpected: {values!r}")
         return mode, width
 
-    def _get_freq(self) -> Optional[int]:
-        resp = self._send("f", expect_value=True).strip()
-        if not resp:
-            if self.debug:
-                logger.debug("[GET FREQ] unexpected empty response")
-            return None
+    def _parse_freq(self, values: Dict[str, str]) -> Optional[int]:
         try:
-            return int(resp.split()[0])
-        except ValueError:
+            return int(float(values["Frequency"]))
+        except (KeyError, ValueError):
             if self.debug:
-                logger.debug(f"[GET FREQ] unexpected: '{resp}'")
+                logger.debug(f"[GET FREQ] unexpected: {values!r}")
             return None
 
     # ---------------------------------------------------------------------
     # Transport
     # ---------------------------------------------------------------------
 
+    def _open_socket(self, timeout: float = 5.0):
+        """Create the TCP connection to rigctld and reset the line buffer."""
+        self._sock = socket.create_connection((self.host, self.port), timeout=timeout)
+        # Tiny 'f\n'/'t\n' requests must not sit in Nagle's buffer.
+        apply_tcp_options(self._sock)
+        self._sock.settimeout(3.0)
+        self._sock_buf.clear()
+
+    def _close_socket(self):
+        """Close the TCP connection (if any) and drop buffered bytes."""
+        if self._sock:
+            try:
+                self._sock.close()
+            except Exception:
+                pass
+            self._sock = None
+        self._sock_buf.clear()
+
     def _reconnect(self, timeout: float = 5.0):
         """Reopen the transport, idempotent (used by event thread on error)."""
-        with self.lock:
-            try:
-                if self._sock:
-                    try: self._sock.close()
-                    except Exception: pass
-                    self._sock = None
-                    self._sock_buf = b""
-                if self.conn:
-                    try: self.conn.close()
-                    except Exception: pass
-                    self.conn = None
-
-                if self._use_socket:
-                    self._sock = socket.create_connection((self.host, self.port), timeout=timeout)
-                    self._sock.settimeout(3.0)
-                    self._sock_buf = b""
-                else:
-                    self.conn = telnetlib.Telnet(self.host, self.port, timeout=timeout)
-                    self.conn.timeout = 2.0
-
-                self.connected = True
-                logger.info(f"[rigctl] reconnected {self.host}:{self.port}")
-            except Exception as e:
-                self.connected = False
-                raise RigctlError(f"Failed to reconnect to rigctld: {e}")
+        with self._io_lock:
+            self._reconnect_locked(timeout)
+
+    def _reconnect_locked(self, timeout: float = 5.0):
+        """Reopen the transport; caller must hold _io_lock."""
+        try:
+            self._close_socket()
+            self._open_socket(timeout)
+            self.connected = True
+            logger.info(f"[rigctl] reconnected {self.host}:{self.port}")
+        except Exception as e:
+            self.connected = False
+            raise RigctlError(f"Failed to reconnect to rigctld: {e}")
 
     def _readline_socket(self, timeout: float = 2.5) -> bytes:
-        """Return one LF-terminated line from raw socket using a persistent buffer."""
-        if self._sock is None:
+        """
+        Return one LF-terminated line from raw socket using a persistent buffer.
+
+        Waits at most `timeout` seconds (select() before each recv), so a short
+        follow-up read really is short; a line that arrived in the same segment
+        as the previous one is served from the buffer without any syscall.
+        """
+        sock = self._sock
+        if sock is None:
             return b""
 
-        end = time.time() + timeout
+        buf = self._sock_buf
+        nl = buf.find(b"\n")
+        if nl < 0:
+            end = time.monotonic() + timeout
+            while True:
+                left = end - time.monotonic()
+                if left <= 0:
+                    break
+                try:
+                    if not select.select([sock], [], [], left)[0]:
+                        break
+                    n = sock.recv_into(self._rx_view)
+                except (OSError, ValueError):  # ValueError: select() on a closed socket (fd -1)
+                    break
+                if not n:
+                    break
+                # Only the freshly received bytes can hold the terminator.
+                start = len(buf)
+                buf += self._rx_view[:n]
+                nl = buf.find(b"\n", start)
+                if nl >= 0:
+                    break
 
-        if b"\n" in self._sock_buf:
-            line, self._sock_buf = self._sock_buf.split(b"\n", 1)
+        if nl >= 0:
+            line = bytes(buf[:nl])
+            del buf[:nl + 1]
+            return line
+        if buf:
+            line = bytes(buf)
+            buf.clear()
             return line
+        return b""
 
-        while time.time() < end:
-            try:
-                chunk = self._sock.recv(4096)
-                if not chunk:
-                    break
-                self._sock_buf += chunk
-                if b"\n" in self._sock_buf:
-                    line, self._sock_buf = self._sock_buf.split(b"\n", 1)
-                    return line
-            except socket.timeout:
-                break
-            except Exception:
+    def _drain_unsolicited(self):
+        """
+        Discard bytes nobody asked for (late replies after a timed-out exchange,
+        or rigctld chatter). Caller must hold _io_lock: no exchange is in flight
+        then, so anything readable would otherwise desync the next reply.
+        Raises ConnectionError if rigctld closed the connection.
+        """
+        s = self._sock
+        if s is None:
+            return
+        stale = bytes(self._sock_buf)
+        self._sock_buf.clear()
+        while select.select([s], [], [], 0)[0]:
+            chunk = s.recv(4096)
+            if not chunk:
+                raise ConnectionError("rigctld closed the connection")
+            stale += chunk
+        if stale and self.debug:
+            logger.debug("[rigctl] dropped unsolicited: %r", stale)
+
+    def _read_block(self) -> List[str]:
+        """Read one extended-protocol reply up to its closing 'RPRT n'."""
+        lines: List[str] = []
+        while True:
+            raw = self._readline_socket(timeout=2.5)
+            if not raw:
+                break  # timeout/closed; return what we have
+            line = raw.decode("ascii", "replace").strip()
+            lines.append(line)
+            if line.startswith(_RPRT):
                 break
+        return lines
 
-        if self._sock_buf:
-            line = self._sock_buf
-            self._sock_buf = b""
-            return line
-        return b""
+    def _exchange_blocks(self, cmds: Sequence[str]) -> List[List[str]]:
+        """Write all commands in one sendall() (pipelined), then read one reply block per command."""
+        if self._sock is None:
+            raise ConnectionError("rigctld socket is not open")
+        self._sock.sendall("".join(f"{c}\n" for c in cmds).encode())
+        return [self._read_block() for _ in cmds]
 
-    def _send(self, cmd: str, quiet: bool = False, expect_value: bool = False) -> str:
-        """Send a rigctl command, return first line, retry once on transport error."""
-        if not quiet and self.debug:
-            logger.debug(f"[rigctl] > {cmd}")
+    def _query_many(self, cmds: Sequence[str]) -> List[Dict[str, str]]:
+        """
+        Send extended-protocol queries ('+f', '+m', ...) and return each one's 'Key: Value' pairs.
+
+        rigctld answers '+' commands with a fixed block terminated by 'RPRT n', e.g.
+          get_mode:
+          Mode: CW
+          Passband: 400
+          RPRT 0
+        so each reply is read in one pass, without guessing whether a value follows.
+        rigctld handles input line by line, so several queries share one write
+        and one round-trip.
+        """
+        if self.debug:
+            logger.debug("[rigctl] > %s", " ".join(cmds))
 
-        with self.lock:
+        with self._io_lock:
             try:
-                data = (cmd + "\n").encode()
-                if self._use_socket:
-                    assert self._sock is not None
-                    self._sock.sendall(data)
-                    line = self._readline_socket(timeout=2.5)
-                else:
-                    assert self.conn is not None
-                    self.conn.write(data)
-                    line = self.conn.read_until(b"\n", timeout=2.0)
-            except Exception as e:
+                blocks = self._exchange_blocks(cmds)
+            except OSError as e:
                 first_err = e
                 if self.debug:
-                    logger.debug(f"[rigctl] comm error, attempting reconnect: {e}")
-                self._reconnect()
+                    logger.debug("[rigctl] comm error, attempting reconnect: %s", e)
+                self._reconnect_locked()
                 try:
-                    if self._use_socket:
-                        assert self._sock is not None
-                        self._sock.sendall((cmd + "\n").encode())
-                        line = self._readline_socket(timeout=2.5)
-                    else:
-                        assert self.conn is not None
-                        self.conn.write((cmd + "\n").encode())
-                        line = self.conn.read_until(b"\n", timeout=2.0)
-                except Exception:
+                    blocks = self._exchange_blocks(cmds)
+                except OSError:
                     raise RigctlError(f"Communication error with rigctld: {first_err}")
 
-        first = line.decode(errors="replace").strip() if line else ""
+        results: List[Dict[str, str]] = []
+        for lines in blocks:
+            if self.debug:
+                logger.debug("[rigctl] < %s", " | ".join(lines))
+            values: Dict[str, str] = {}
+            for line in lines:
+                key, sep, val = line.partition(":")
+                val = val.strip()
+                if sep and val:
+                    values[key.strip()] = val
+            results.append(values)
+        return results
+
+    def _send(self, cmd: str, quiet: bool = False, expect_value: bool = False) -> str:
+        """Send a rigctl command, return first line, retry once on transport error."""
         if not quiet and self.debug:
-            logger.debug(f"[rigctl] < {first}")
+            logger.debug("[rigctl] > %s", cmd)
+        return self._send_bytes(f"{cmd}\n".encode(), quiet=quiet, expect_value=expect_value)
 
-        # Some builds echo "RPRT 0" first, then deliver the actual value next
-        if expect_value and (first == "" or first.upper().startswith("RPRT")):
-            try:
-                if self._use_socket:
-                    extra = self._readline_socket(timeout=0.3)
-                else:
-                    extra = self.conn.read_until(b"\n", timeout=0.3) if self.conn else b""
-                extra_dec = extra.decode(errors="replace").strip() if extra else ""
-                if extra_dec and not extra_dec.upper().startswith("RPRT"):
-                    if self.debug:
-                        logger.debug(f"[rigctl] << {extra_dec}")
-                    return extra_dec
-            except Exception:
-                pass
+    def _send_bytes(self, data: bytes, quiet: bool = False, expect_value: bool = False) -> str:
+        """_send() for an already encoded, newline-terminated command."""
+        resp = self._send_bytes_raw(data, expect_value=expect_value).decode("ascii", "replace")
+        if not quiet and self.debug:
+            logger.debug("[rigctl] < %s", resp)
+        return resp
 
-        # Telnet: drain tail to avoid contaminating next call
-        if not self._use_socket and self.conn:
+    def _send_bytes_raw(self, data: bytes, expect_value: bool = False) -> bytes:
+        """
+        Exchange one encoded command and return the stripped reply line as bytes
+        (no decode); the PTT monitor parses it directly.
+        """
+        with self._io_lock:
             try:
-                peek = self.conn.read_very_eager()
-                if peek and self.debug:
-                    tail = peek.decode(errors="replace").strip()
-                    if tail:
-                        logger.debug(f"[rigctl] (drained) {tail}")
-            except Exception:
-                pass
+                if self._sock is None:
+                    raise ConnectionError("rigctld socket is not open")
+                self._sock.sendall(data)
+                line = self._readline_socket(timeout=2.5)
+            except OSError as e:
+                first_err = e
+                if self.debug:
+                    logger.debug("[rigctl] comm error, attempting reconnect: %s", e)
+                self._reconnect_locked()
+                try:
+                    if self._sock is None:
+                        raise ConnectionError("rigctld socket is not open")
+                    self._sock.sendall(data)
+                    line = self._readline_socket(timeout=2.5)
+                except OSError:
+                    raise RigctlError(f"Communication error with rigctld: {first_err}")
 
-        return first
+            # Some builds echo "RPRT 0" first, then deliver the actual value next.
+            # Read it while we still own the socket; it usually arrived with the
+            # first line and comes straight from the buffer.
+            head = line.strip()
+            extra = b""
+            if expect_value and (not head or head.startswith(_RPRT_B)):
+                try:
+                    extra = self._readline_socket(timeout=0.3).strip()
+                except OSError:
+                    extra = b""
+
+        if extra and not extra.startswith(_RPRT_B):
+            return extra
+        return head
 
     # Optional, used by app when printing
     def get_label(self) -> str:
@@ -443,6 +512,10 @@ class RigctlClient(BaseRadioClient):
     def _ptt_monitor_loop(self):
         """
         Poll 't' with modest cadence and notify waiters on state edges.
+
+        The wait between polls is a select() on the socket rather than a sleep:
+        if rigctld pushes anything (or closes) while we are idle, it is drained
+        at once instead of being read as the answer to the next 't'.
         Handles:
           - RPRT -11 -> mark ptt_supported=False, disable event support.
           - Transport errors -> single reconnect attempt, then disable event support.
@@ -450,24 +523,28 @@ class RigctlClient(BaseRadioClient):
         try:
             while not self._evt_stop.is_set():
                 try:
-                    resp = self._send("t", quiet=True, expect_value=True).strip()
-                except Exception as e:
+                    self._wait_idle(self._next_poll_s())
+                    if self._evt_stop.is_set():
+                        break
+                    # Stays bytes: int(b"1") parses without a decode.
+                    resp = self._send_bytes_raw(self._CMD_T, expect_value=True)
+                except (RigctlError, OSError) as e:
                     # Transport hiccup: single reconnect attempt
                     if self._reconnect_once:
                         if self.debug:
-                            logger.debug(f"[PTT EVT] transport error: {e}, trying reconnect")
+                            logger.debug("[PTT EVT] transport error: %s, trying reconnect", e)
                         try:
                             self._reconnect()
                             self._reconnect_once = False
                             time.sleep(0.1)
                             continue
-                        except Exception as e2:
+                        except RigctlError as e2:
                             logger.debug(f"[PTT EVT] reconnect failed: {e2}")
                     # Give up on event mode; keep app alive with polling
                     self._disable_event_mode("transport error")
                     return
 
-                if resp.upper().startswith("RPRT -11"):
+                if resp.startswith(_RPRT_UNSUPPORTED_B):
                     # No PTT capability -> MANUAL
                     self.ptt_supported = False
                     self._set_ptt_state(False)
@@ -477,27 +554,57 @@ class RigctlClient(BaseRadioClient):
                 # Parse 't' value
                 active = False
                 try:
-                    active = int(resp.split()[0]) != 0
-                except Exception:
+                    active = int(resp.split(None, 1)[0]) != 0
+                except (ValueError, IndexError):
                     if self.debug:
-                        logger.debug(f"[PTT EVT] unexpected 't' response: '{resp}'")
+                        logger.debug("[PTT EVT] unexpected 't' response: %r", resp)
 
+                # Cadence (next _wait_idle): slower when idle, slightly faster while TX
                 self._set_ptt_state(active)
 
-                # Cadence: slower when idle, slightly faster while TX
-                time.sleep(self._poll_tx_s if active else self._poll_idle_s)
-
         finally:
             # On exit, leave supports_event_ptt as-is unless we explicitly disabled it.
             return
 
+    def _next_poll_s(self) -> float:
+        """Poll interval for the next 't': fast while TX, backing off during long RX."""
+        if self._ptt_active:
+            return self._poll_tx_s
+        over = self._rx_streak - self._BACKOFF_AFTER
+        if over <= 0:
+            return self._poll_idle_s
+        return min(self._POLL_IDLE_MAX, self._poll_idle_s * (1.5 ** over))
+
+    def _wait_idle(self, poll_s: float):
+        """Sleep up to poll_s in select() on the socket; drain it if data shows up."""
+        s = self._sock
+        if s is None:
+            return  # _send() reports the closed socket and triggers the reconnect path
+        try:
+            readable = select.select([s], [], [], poll_s)[0]
+        except (OSError, ValueError):
+            return  # socket closed under us (shutdown/reconnect)
+        if readable:
+            with self._io_lock:
+                if self._sock is s:
+                    self._drain_unsolicited()
+
     def _set_ptt_state(self, active: bool):
-        """Update PTT state and notify waiters on edges."""
-        with self._ptt_cond:
-            self._ptt_active = bool(active)
-            if self._ptt_active != self._ptt_last:
-                self._ptt_last = self._ptt_active
-                self._ptt_cond.notify_all()
+        """Update PTT state and flip the TX Events on real edges only."""
+        active = bool(active)
+        if active == self._ptt_active:
+            # Stop counting once the cap is reached (keeps 1.5**n bounded).
+            if not active and self._next_poll_s() < self._POLL_IDLE_MAX:
+                self._rx_streak += 1
+            return
+        self._ptt_active = active
+        self._rx_streak = 0
+        if active:
+            self._tx_stopped.clear()
+            self._tx_started.set()
+        else:
+            self._tx_started.clear()
+            self._tx_stopped.set()
 
     def _disable_event_mode(self, reason: str):
         """Disable event-driven support; the app can fall back to polling or manual."""
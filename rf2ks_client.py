@@ -1,14 +1,36 @@
 import time as _time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from decimal import Decimal, InvalidOperation, ROUND_HALF_EVEN
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, HTTPError, Timeout, ConnectionError
+from urllib3.util.retry import Retry
 from loghandler import get_logger, get_tuner_logger
 from typing import Optional, Tuple
 
+# Optional faster JSON decoder; both raise ValueError subclasses on bad input.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
 # Module-level loggers & header state
 logger = None
 tuner_logger = None
 _header_written = False
 
+# _request() error messages, checked in order with isinstance() so requests'
+# subclasses (ReadTimeout, ConnectTimeout, ...) map like the old except-chains.
+_HTTP_ERRORS = (
+    (Timeout, "Connection to RF2K-S timed out while {context}."),
+    (ConnectionError, "Could not connect to RF2K-S while {context}."),
+    (HTTPError, "HTTP error while {context}: {e}"),
+    (RequestException, "Communication error with RF2K-S while {context}: {e}"),
+    (ValueError, "Failed to parse JSON response from RF2K-S while {context}."),
+)
+
 
 class RF2KSClientError(Exception):
     """Custom exception class for RF2KSClient errors."""
@@ -31,6 +53,57 @@ class RF2KSClient:
         self.port = amp_cfg.get("port", 8080)
         self.base_url = f"http://{self.host}:{self.port}"
 
+        # One keep-alive HTTP session for all amplifier calls (single host, sequential use).
+        # Transient failures are retried by the adapter: one reconnect (nothing was
+        # sent yet) and up to two 5xx replies. Read timeouts are not retried so a
+        # stalled PA does not multiply the caller's timeout.
+        retry = Retry(
+            total=2,
+            connect=1,
+            read=0,
+            status=2,
+            backoff_factor=0.1,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "PUT"}),
+            raise_on_status=False,  # hand the last reply to raise_for_status()
+        )
+        self._session = requests.Session()
+        self._session.headers.update({"Accept": "application/json"})
+        self._session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=retry))
+        # /power is read once after unkey and must stay single-shot (see read_power_post_unkey);
+        # the longer prefix wins, so it gets its own adapter without the retry policy.
+        self._session.mount(f"{self.base_url}/power", HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0))
+
+        # One worker for the post-unkey /power read, so it overlaps the /tuner read
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rf2ks-power")
+
+    def close(self) -> None:
+        """Release the pooled HTTP connection(s) and the background worker."""
+        self._pool.shutdown(wait=False)
+        self._session.close()
+
+    def _request(self, method: str, path: str, *, context: str, log=None, decode: bool = True, **kw):
+        """
+        Perform one HTTP call against the amplifier and return the decoded JSON
+        body (None if empty or decode=False). Any transport, HTTP-status or JSON failure is
+        logged once via `log` (default: logger.error) and raised as
+        RF2KSClientError with a message naming `context`.
+        """
+        try:
+            response = self._session.request(method, self.base_url + path, **kw)
+            response.raise_for_status()
+            if not (decode and response.content):
+                return None
+            data = _loads(response.content)
+            if not isinstance(data, dict):
+                # Valid JSON but not an object: callers .get() on it, so treat as a parse failure
+                raise ValueError(f"expected a JSON object, got {type(data).__name__}")
+            return data
+        except (RequestException, ValueError) as e:
+            msg = next(text for cls, text in _HTTP_ERRORS if isinstance(e, cls)).format(context=context, e=e)
+            (log or logger.error)(f"[RF2K-S] {msg}")
+            raise RF2KSClientError(msg) from e
+
     # -------------------------------------------------------------------------
     # Basic amplifier info & operate mode
     # -------------------------------------------------------------------------
@@ -38,84 +111,39 @@ class RF2KSClient:
         """Fetch and log basic amplifier info (device/name/firmware)."""
         if not self.enabled:
             return
-        try:
-            response = requests.get(
-                f"{self.base_url}/info",
-                headers={"Accept": "application/json"},
-                timeout=8
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            device = data.get("device", "N/A")
-            name = data.get("custom_device_name", "N/A")
-            fw_gui = data.get("software_version", {}).get("GUI", "N/A")
-            fw_ctrl = data.get("software_version", {}).get("controller", "N/A")
-
-            logger.info("[RF2K-S] Amplifier Info:")
-            logger.info(f"  Device:     {device}")
-            logger.info(f"  Name:       {name}")
-            logger.info(f"  FW GUI:     {fw_gui}")
-            logger.info(f"  FW Ctrl:    {fw_ctrl}")
-
-        except Timeout:
-            logger.error("[ERROR] Connection to RF2K-S timed out.")
-            raise RF2KSClientError("Connection to RF2K-S timed out.")
-        except ConnectionError:
-            logger.error("[ERROR] Could not connect to RF2K-S.")
-            raise RF2KSClientError("Could not connect to RF2K-S.")
-        except HTTPError as e:
-            logger.error(f"[ERROR] HTTP error while fetching RF2K-S info: {e}")
-            raise RF2KSClientError(f"HTTP error while fetching RF2K-S info: {e}")
-        except RequestException as e:
-            logger.error(f"[ERROR] Unexpected error while communicating with RF2K-S: {e}")
-            raise RF2KSClientError(f"Unexpected communication error with RF2K-S: {e}")
-        except ValueError:
-            logger.error("[ERROR] Failed to parse JSON response from RF2K-S.")
-            raise RF2KSClientError("Failed to parse JSON response from RF2K-S.")
-        except Exception as e:
-            logger.error(f"[ERROR] Unexpected exception: {e}")
-            raise RF2KSClientError(f"Unexpected exception: {e}")
+        data = self._request("GET", "/info", context="fetching RF2K-S info", timeout=8) or {}
+
+        device = data.get("device", "N/A")
+        name = data.get("custom_device_name", "N/A")
+        sw = _as_dict(data.get("software_version"))
+        fw_gui = sw.get("GUI", "N/A")
+        fw_ctrl = sw.get("controller", "N/A")
+
+        logger.info("[RF2K-S] Amplifier Info:")
+        logger.info(f"  Device:     {device}")
+        logger.info(f"  Name:       {name}")
+        logger.info(f"  FW GUI:     {fw_gui}")
+        logger.info(f"  FW Ctrl:    {fw_ctrl}")
 
     def get_operate_mode(self) -> str:
         """Return current RF2K-S operate mode (e.g., 'OPERATE', 'STANDBY')."""
-        try:
-            response = requests.get(
-                f"{self.base_url}/operate-mode",
-                headers={"Accept": "application/json"},
-                timeout=3,
-            )
-            response.raise_for_status()
-            return response.json().get("operate_mode", "").upper()
-        except RequestException as e:
-            logger.warning(f"[RF2K-S] Could not retrieve operate mode: {e}")
-            raise RF2KSClientError(f"Could not retrieve operate mode: {e}")
+        data = self._request(
+            "GET", "/operate-mode", context="reading operate mode", log=logger.warning, timeout=3
+        ) or {}
+        return str(data.get("operate_mode", "")).upper()
 
     def set_operate_mode(self, mode: str):
-        """Set RF2K-S operate mode only if different from current."""
-        try:
-            current_mode = self.get_operate_mode()
-            if current_mode == mode.upper():
-                logger.info(f"[RF2K-S] Amplifier already in {mode.upper()} mode. No action needed.")
-                return
-
-            response = requests.put(
-                f"{self.base_url}/operate-mode",
-                json={"operate_mode": mode},
-                headers={"Accept": "application/json", "Content-Type": "application/json"},
-                timeout=3,
-            )
-            response.raise_for_status()
-            logger.info(f"[RF2K-S] Amplifier successfully set to {mode.upper()} mode.")
-        except HTTPError as e:
-            logger.error(f"[ERROR] Failed to set RF2K-S to {mode.upper()} mode: {e}")
-            raise RF2KSClientError(f"Failed to set RF2K-S to {mode.upper()} mode: {e}")
-        except RequestException as e:
-            logger.error(f"[ERROR] Request error while setting RF2K-S to {mode.upper()} mode: {e}")
-            raise RF2KSClientError(f"Request error while setting RF2K-S to {mode.upper()} mode: {e}")
-        except Exception as e:
-            logger.error(f"[ERROR] Unexpected error while setting RF2K-S to {mode.upper()} mode: {e}")
-            raise RF2KSClientError(f"Unexpected error while setting RF2K-S to {mode.upper()} mode: {e}")
+        """
+        Set RF2K-S operate mode with a single PUT (the endpoint is idempotent).
+        """
+        self._request(
+            "PUT", "/operate-mode",
+            context=f"setting RF2K-S to {mode.upper()} mode",
+            json={"operate_mode": mode},
+            decode=False,
+            timeout=3,
+        )
+        logger.info(f"[RF2K-S] Amplifier successfully set to {mode.upper()} mode.")
 
     # -------------------------------------------------------------------------
     # Frequency verification (truncated kHz grid match)
@@ -133,6 +161,11 @@ class RF2KSClient:
         Success condition:
         truncate_kHz(amp_reported_hz) == truncate_kHz(expected_hz)
 
+        Budget: the last probe happens (max_tries - 1) * delay_s after the first,
+        as before, but probes inside that window start 50 ms apart and double up
+        to delay_s, so a PA that catches up quickly is confirmed quickly. At least
+        max_tries probes are made, and no sleep follows the final one.
+
         Raises RF2KSClientError if no match within budget.
         """
         expected_hz = int(round(float(expected_freq_mhz) * 1_000_000))
@@ -141,30 +174,37 @@ class RF2KSClient:
         last_seen: Optional[int] = None
         last_err: Optional[Exception] = None
 
-        for _ in range(max_tries):
+        # Loop invariants hoisted; the Session already carries the Accept header.
+        url = f"{self.base_url}/data"
+        get = self._session.get
+        normalize, truncate = _normalize_hz, _truncate_to_khz
+
+        deadline = _time.monotonic() + max(0, max_tries - 1) * float(delay_s)
+        attempt = 0
+        while True:
             try:
-                r = requests.get(
-                    f"{self.base_url}/data",
-                    headers={"Accept": "application/json"},
-                    timeout=1.5
-                )
+                r = get(url, timeout=1.5)
                 r.raise_for_status()
-                payload = r.json() or {}
-                freq = payload.get("frequency") or {}
-                hz = _normalize_hz(freq.get("value"), freq.get("unit"))
+                freq = _as_dict(_as_dict(_loads(r.content)).get("frequency"))
+                hz = normalize(freq.get("value"), freq.get("unit"))
                 if hz is not None:
                     last_seen = hz
-                    if _truncate_to_khz(hz) == expected_trunc:
+                    if truncate(hz) == expected_trunc:
                         if logger:
                             logger.debug(
                                 f"[RF2K-S] /data OK: amp={hz} Hz ~ radio={expected_hz} Hz (trunc kHz)."
                             )
                         return
-            except Exception as e:
+            except (RequestException, ValueError) as e:
+                # Retries are exhausted by now; count it as one "not yet" probe.
                 last_err = e
 
-            # Short backoff; the PA needs a brief moment to catch up with CAT
-            _time.sleep(delay_s)
+            attempt += 1
+            left = deadline - _time.monotonic()
+            if left <= 0 and attempt >= max_tries:
+                break
+            # Backoff: probe fast first, then give the PA longer to catch up with CAT
+            _time.sleep(max(0.0, min(left, float(delay_s), 0.05 * (2 ** (attempt - 1)))))
 
         msg = (
             f"/data did not report expected frequency (truncated kHz). "
@@ -180,13 +220,8 @@ class RF2KSClient:
     def read_tuner(self, timeout_s: float = 7.0) -> dict:
         """Fetch /tuner JSON; non-fatal. Returns {} on error."""
         try:
-            url = f"{self.base_url.rstrip('/')}/tuner"
-            resp = requests.get(url, headers={"Accept": "application/json"}, timeout=float(timeout_s))
-            resp.raise_for_status()
-            return resp.json() or {}
-        except Exception as e:
-            if logger:
-                logger.error(f"[ERROR] Could not fetch tuner data: {e}")
+            return self._request("GET", "/tuner", context="fetching tuner data", timeout=float(timeout_s)) or {}
+        except RF2KSClientError:
             return {}
 
     # -------------------------------------------------------------------------
@@ -212,39 +247,44 @@ class RF2KSClient:
 
         On any error, returns (None, None) and logs at DEBUG.
         """
+        _time.sleep(max(0.0, float(delay_s)))
         try:
-            _time.sleep(max(0.0, float(delay_s)))
-            url = f"{self.base_url.rstrip('/')}/power"
-            resp = requests.get(url, headers={"Accept": "application/json"}, timeout=float(timeout_s))
-            resp.raise_for_status()
-            payload = resp.json() or {}
+            payload = self._request(
+                "GET", "/power", context="reading /power after unkey (ignored)",
+                log=logger.debug, timeout=float(timeout_s),
+            ) or {}
+        except RF2KSClientError:
+            return None, None
 
-            fwd = payload.get("forward") or {}
-            swr = payload.get("swr") or {}
+        fwd = _as_dict(payload.get("forward"))
+        swr = _as_dict(payload.get("swr"))
 
-            drive_used_w: Optional[int] = None
-            if fwd.get("max_value") is not None:
-                try:
-                    drive_used_w = int(fwd["max_value"])
-                except Exception:
-                    try:
-                        drive_used_w = int(float(fwd["max_value"]))
-                    except Exception:
-                        drive_used_w = None
-
-            swr_final: Optional[float] = None
-            if swr.get("max_value") is not None:
+        drive_used_w: Optional[int] = None
+        if fwd.get("max_value") is not None:
+            try:
+                drive_used_w = int(fwd["max_value"])
+            except (TypeError, ValueError):
                 try:
-                    swr_final = float(swr["max_value"])
-                except Exception:
-                    swr_final = None
+                    drive_used_w = int(float(fwd["max_value"]))
+                except (TypeError, ValueError):
+                    drive_used_w = None
+
+        swr_final: Optional[float] = None
+        if swr.get("max_value") is not None:
+            try:
+                swr_final = float(swr["max_value"])
+            except (TypeError, ValueError):
+                swr_final = None
 
-            return drive_used_w, swr_final
+        return drive_used_w, swr_final
 
-        except Exception as e:
-            if logger:
-                logger.debug(f"/power read after unkey failed (ignored): {e}")
-            return None, None
+    def submit_power_post_unkey(
+        self,
+        delay_s: float = 0.2,
+        timeout_s: float = 2.0
+    ) -> "Future[Tuple[Optional[int], Optional[float]]]":
+        """Run read_power_post_unkey() on the background worker; returns its Future."""
+        return self._pool.submit(self.read_power_post_unkey, delay_s, timeout_s)
 
     # -------------------------------------------------------------------------
     # CSV logger
@@ -260,23 +300,29 @@ class RF2KSClient:
         - Always reads /tuner for the base fields.
         - If `used_auto_ptt` is True, performs ONE /power read ~0.2 s after unkey
         to capture forward.max_value (drive_used_W) and swr.max_value (swr_final).
+        It runs in the background while /tuner is read here.
         - If manual PTT, the final two columns are left blank.
         """
         global _header_written
 
-        # Optional PA summary after unkey (one request; non-fatal)
-        drive_used_w: Optional[int] = None
-        swr_final: Optional[float] = None
-        if used_auto_ptt:
-            drive_used_w, swr_final = self.read_power_post_unkey(delay_s=0.2, timeout_s=2.0)
+        # Optional PA summary after unkey (one request; non-fatal), started first
+        power_fut = self.submit_power_post_unkey(delay_s=0.2, timeout_s=2.0) if used_auto_ptt else None
 
         # Base tuner snapshot
         data = self.read_tuner(timeout_s=7.0)
 
-        tf = data.get("tuned_frequency") or {}
-        ss = data.get("segment_size") or {}
-        Ld = data.get("L") or {}
-        Cd = data.get("C") or {}
+        drive_used_w: Optional[int] = None
+        swr_final: Optional[float] = None
+        if power_fut is not None:
+            try:
+                drive_used_w, swr_final = power_fut.result(timeout=3.0)
+            except FutureTimeout:
+                logger.debug("/power read after unkey did not finish in time (ignored)")
+
+        tf = _as_dict(data.get("tuned_frequency"))
+        ss = _as_dict(data.get("segment_size"))
+        Ld = _as_dict(data.get("L"))
+        Cd = _as_dict(data.get("C"))
 
         freq_kHz = tf.get("value")
         seg_size = ss.get("value")
@@ -306,26 +352,36 @@ class RF2KSClient:
 
 # --- Module level helpers -----------------------------------------------------
 
+_HZ_PER_UNIT = {"": 1, "hz": 1, "khz": 1_000, "mhz": 1_000_000}
+
+
+def _as_dict(value) -> dict:
+    """`value` if it is a JSON object, else {} (guards .get() on lists/null/strings)."""
+    return value if isinstance(value, dict) else {}
+
+
 def _normalize_hz(value, unit) -> Optional[int]:
     """
     Convert a frequency {value, unit} pair to Hz (int).
     Accepts unit in {"Hz","kHz","MHz"} (any case). Returns None on failure.
+
+    Integers are scaled directly; anything else goes through Decimal(str(value)),
+    so 14.255 MHz is exactly 14255000 Hz (no float product landing on ...999).
     """
     if value is None:
         return None
+    scale = _HZ_PER_UNIT.get(str(unit or "").strip().lower())
+    if scale is None:
+        return None
+    if isinstance(value, int):
+        return value * scale
     try:
-        v = float(value)
-    except Exception:
+        d = Decimal(str(value).strip())
+    except InvalidOperation:
         return None
-
-    u = (unit or "").strip().lower()
-    if u == "hz" or u == "":
-        return int(round(v))
-    if u == "khz":
-        return int(round(v * 1e3))
-    if u == "mhz":
-        return int(round(v * 1e6))
-    return None
+    if not d.is_finite():
+        return None
+    return int((d * scale).to_integral_value(rounding=ROUND_HALF_EVEN))
 
 
 def _truncate_to_khz(hz: Optional[int]) -> Optional[int]:
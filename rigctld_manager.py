@@ -1,16 +1,41 @@
 # rigctld_manager.py
+import errno
+import json
+import logging
+import re
+import selectors
 import shutil
 import subprocess
 import time
 import sys
 import socket
 import os
+import tempfile
 import platform
-from typing import Optional, Any, List
+from pathlib import Path
+from typing import Optional, Any, Dict, List
 from loghandler import get_logger
 
 logger = None
 
+# connect_ex() results meaning "in progress" for a non-blocking socket (Windows: WSAEWOULDBLOCK)
+_CONNECT_PENDING = tuple(
+    getattr(errno, name) for name in ("EINPROGRESS", "EWOULDBLOCK", "EAGAIN", "WSAEWOULDBLOCK")
+    if hasattr(errno, name)
+)
+
+# `rigctl -l` row: model ID, manufacturer, model name (name columns may be absent)
+_MODEL_LINE_RE = re.compile(r"^[ \t]*(\d+)[ \t]+(\S+)(?:[ \t]+(\S+))?", re.M)
+
+
+def _model_cache_path() -> Path:
+    """Per-user cache file for the parsed `rigctl -l` model table."""
+    if platform.system() == "Windows":
+        base = Path(os.environ.get("LOCALAPPDATA", str(Path.home() / "AppData/Local")))
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME", str(Path.home() / ".cache")))
+    return base / "rf2k-trainer" / "rigctl-models.json"
+
 
 class RigCtldManagerError(Exception):
     """Generic rigctld manager error (superclass for all rigctld manager errors)."""
@@ -83,12 +108,37 @@ class RigctldManager:
     # Internals
     # ---------------------------------------------------------------------
 
-    def _port_is_occupied(self) -> bool:
+    def _port_is_occupied(self, timeout: float = 0.5) -> bool:
         """Return True if something is listening on 127.0.0.1:<port>."""
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(0.5)
-            result = sock.connect_ex(("127.0.0.1", self.port))
-            return result == 0
+            sock.setblocking(False)
+            rc = sock.connect_ex(("127.0.0.1", self.port))
+            if rc in _CONNECT_PENDING:
+                # Let the kernel report completion instead of blocking in connect()
+                with selectors.DefaultSelector() as sel:
+                    sel.register(sock, selectors.EVENT_WRITE)
+                    if not sel.select(timeout):
+                        return False
+                rc = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+            return rc == 0
+
+    def _wait_port_ready(self, deadline: float) -> bool:
+        """
+        Wait until rigctld accepts on 127.0.0.1:<port>, it exits, or `deadline`
+        (time.monotonic()) passes. A port with no listener is refused at once, so
+        retries start 20 ms apart and back off to 200 ms.
+        """
+        delay = 0.02
+        while True:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                return False
+            if self._port_is_occupied(timeout=min(left, 0.5)):
+                return True
+            if self.process is not None and self.process.poll() is not None:
+                return False  # rigctld died (bad serial port, ...); no point waiting
+            time.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+            delay = min(delay * 2, 0.2)
 
     def _build_command(self) -> List[str]:
         """Build the rigctld command line with platform and model nuances."""
@@ -112,6 +162,50 @@ class RigctldManager:
 
         return cmd
 
+    def _debug(self) -> bool:
+        return bool(self.context and getattr(self.context, "debug_mode", False))
+
+    @staticmethod
+    def _stderr_log_path() -> Path:
+        """rigctld stderr file, next to our own log file (temp dir if there is none)."""
+        for h in logging.getLogger().handlers:
+            if isinstance(h, logging.FileHandler):
+                return Path(h.baseFilename).parent / "rigctld-stderr.log"
+        return Path(tempfile.gettempdir()) / "rigctld-stderr.log"
+
+    @staticmethod
+    def _stderr_tail(path: Optional[Path], limit: int = 2000) -> str:
+        """Last `limit` bytes of rigctld's stderr file, or '' if unavailable."""
+        if path is None:
+            return ""
+        try:
+            with open(path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - limit))
+                return f.read().decode("utf-8", "replace").strip()
+        except OSError:
+            return ""
+
+    def _popen_kwargs(self) -> dict:
+        """
+        Spawn options for rigctld: no stdin, its own process group/session so a
+        Ctrl+C in our console does not kill it mid-tune (stop() terminates it).
+        Outside debug mode stdout is discarded; stderr goes to a file (see
+        start()) so rigctld's own startup errors are not lost. In debug mode the
+        -vvvv trace stays on the console as before.
+        """
+        debug = self._debug()
+        kwargs: dict = {"stdin": subprocess.DEVNULL, "close_fds": True}
+        if not debug:
+            kwargs["stdout"] = subprocess.DEVNULL
+        if platform.system() == "Windows":
+            # Stay attached to our console (no DETACHED_PROCESS): closing the window
+            # must still take rigctld down, or an orphan keeps holding the COM port.
+            kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            kwargs["start_new_session"] = True
+        return kwargs
+
     # ---------------------------------------------------------------------
     # Public API
     # ---------------------------------------------------------------------
@@ -130,21 +224,26 @@ class RigctldManager:
         logger.debug(f"Starting rigctld with command: {' '.join(cmd)}")
 
         try:
-            # Start detached child, no stdout/stderr capture to keep behavior identical
-            self.process = subprocess.Popen(cmd)
+            kwargs = self._popen_kwargs()
+            stderr_path: Optional[Path] = None
+            if not self._debug():
+                stderr_path = self._stderr_log_path()
+                # The child keeps its own handle; ours is closed right after spawning.
+                with open(stderr_path, "wb") as err:
+                    self.process = subprocess.Popen(cmd, stderr=err, **kwargs)
+                logger.debug(f"rigctld stderr is written to {stderr_path}")
+            else:
+                self.process = subprocess.Popen(cmd, **kwargs)
 
             # Wait for the port to become available
-            timeout = 5.0
-            interval = 0.2
-            waited = 0.0
-            while waited < timeout:
-                if self._port_is_occupied():
-                    break
-                time.sleep(interval)
-                waited += interval
-
-            if not self._port_is_occupied():
+            if not self._wait_port_ready(time.monotonic() + 5.0):
                 msg = "rigctld did not start correctly or failed to bind to the port."
+                rc = self.process.poll()
+                if rc is not None:
+                    msg += f" (rigctld exited with code {rc})"
+                tail = self._stderr_tail(stderr_path)
+                if tail:
+                    msg += f"\nrigctld said:\n{tail}"
                 logger.error(msg)
                 raise RigCtldManagerError(msg)
 
@@ -174,11 +273,44 @@ class RigctldManager:
 
     def validate_model_id(self) -> None:
         """
-        Validates that the rig model exists by running `rigctl -l`.
+        Validates that the rig model exists in the `rigctl -l` model table.
         If `rigctld_path` is specified, assume `rigctl` is in the same directory.
+
+        The parsed table only changes when Hamlib does, so it is cached on disk
+        keyed by the rigctl binary's path, mtime and size; a hit skips the
+        subprocess (and the Hamlib load) entirely.
         """
         rigctl_bin = self.rigctl_path or "rigctl"
 
+        models = self._load_model_cache(rigctl_bin)
+        output: Optional[str] = None
+        if models is None:
+            output = self._list_models(rigctl_bin)
+            models = self._parse_models(output)
+            self._store_model_cache(rigctl_bin, models)
+
+        if self.model not in models:
+            if output is None:
+                output = self._list_models(rigctl_bin)  # full listing for the user
+            sys.stdout.write(f"\n[!] Invalid rig model ID: {self.model}\n")
+            sys.stdout.write("[i] Available rig models:\n\n")
+            for line in output.splitlines():
+                head = line.lstrip()
+                if head.startswith("Rig #") or head[:1].isdigit():
+                    print("   " + line)
+            print()
+            sys.stdout.flush()
+
+            raise RigCtldManagerError(
+                f"Invalid rig model ID {self.model}. Please select a valid model ID from the list above "
+                "and update settings.yml accordingly (radio.rigctld_model)."
+            )
+
+        # Manufacturer and model name for rig_description
+        self.rig_description = models[self.model] or None
+
+    def _list_models(self, rigctl_bin: str) -> str:
+        """Run `rigctl -l` and return its output text."""
         try:
             result = subprocess.run([rigctl_bin, "-l"], capture_output=True, text=True)
         except FileNotFoundError:
@@ -204,35 +336,52 @@ class RigctldManager:
                 "This may indicate a broken Hamlib installation or missing runtime dependencies.\n\n"
                 f"🔧 rigctl path: {rigctl_bin}"
             )
+        return output
 
-        model_lines = output.splitlines()
-        model_ids = set()
-
-        for line in model_lines:
-            parts = line.strip().split()
-            if len(parts) >= 2 and parts[0].isdigit():
-                model_ids.add(int(parts[0]))
-
-        if self.model not in model_ids:
-            sys.stdout.write(f"\n[!] Invalid rig model ID: {self.model}\n")
-            sys.stdout.write("[i] Available rig models:\n\n")
-            for line in model_lines:
-                if line.strip().startswith("Rig #") or line.strip()[0].isdigit():
-                    print("   " + line)
-            print()
-            sys.stdout.flush()
-
-            raise RigCtldManagerError(
-                f"Invalid rig model ID {self.model}. Please select a valid model ID from the list above "
-                "and update settings.yml accordingly (radio.rigctld_model)."
-            )
+    @staticmethod
+    def _parse_models(output: str) -> Dict[int, str]:
+        """Map model ID -> 'Manufacturer Model' ('' if the line has no name columns)."""
+        return {
+            int(m.group(1)): f"{m.group(2)} {m.group(3)}" if m.group(3) else ""
+            for m in _MODEL_LINE_RE.finditer(output)
+        }
 
-        # Extract manufacturer and model name for rig_description
-        for line in model_lines:
-            parts = line.strip().split()
-            if len(parts) >= 3 and parts[0].isdigit() and int(parts[0]) == self.model:
-                self.rig_description = f"{parts[1]} {parts[2]}"
-                break
+    @staticmethod
+    def _model_cache_key(rigctl_bin: str) -> Optional[Dict[str, Any]]:
+        try:
+            st = os.stat(rigctl_bin)
+        except OSError:
+            return None
+        return {"bin": os.path.abspath(rigctl_bin), "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+    def _load_model_cache(self, rigctl_bin: str) -> Optional[Dict[int, str]]:
+        """Return the cached model table if it was built from this exact rigctl binary."""
+        key = self._model_cache_key(rigctl_bin)
+        if key is None:
+            return None
+        try:
+            with open(_model_cache_path(), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("key") != key:
+                return None
+            return {int(k): str(v) for k, v in data["models"].items()}
+        except (OSError, ValueError, KeyError, AttributeError, TypeError):
+            return None
+
+    def _store_model_cache(self, rigctl_bin: str, models: Dict[int, str]) -> None:
+        """Best-effort write of the model table cache (atomic replace)."""
+        key = self._model_cache_key(rigctl_bin)
+        if key is None:
+            return
+        path = _model_cache_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "models": {str(k): v for k, v in models.items()}}, f)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.debug(f"Could not write rigctl model cache {path}: {e}")
 
     def get_description(self) -> Optional[str]:
         return self.rig_description
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 from typing import Optional, Set, Tuple, List
+import sys
 import time as _time
 
 from band_math import calculate_tuning_frequencies
@@ -36,15 +37,25 @@ def _should_verify_freq(ctx: "AppContext", rf2ks: "RF2KSClient") -> bool:
         return False
     return True
 
+def _tick(data: bytes) -> None:
+    """Write progress bytes straight to the stdout buffer (no print/codec overhead)."""
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        # Replaced stdout without a binary layer (IDE consoles etc.)
+        print(data.decode("ascii"), end="", flush=True)
+        return
+    out.write(data)
+    out.flush()
+
 def _wait_event_with_dots(wait_fn, total_timeout: float, waiting_label: str) -> bool:
     """Call a client's wait_* method in short steps to keep printing dots."""
-    import time
+    now = _time.monotonic
     print(f"[WAIT] {waiting_label}", end="", flush=True)
-    deadline = time.time() + total_timeout
+    deadline = now() + total_timeout
     step = 0.5
     dots = 0
     while True:
-        left = deadline - time.time()
+        left = deadline - now()
         if left <= 0:
             print(" timeout.")
             return False
@@ -54,10 +65,41 @@ def _wait_event_with_dots(wait_fn, total_timeout: float, waiting_label: str) ->
             else:
                 print(" done.")
             return True
-        print(".", end="", flush=True)
         dots += 1
-        if dots % 10 == 0:
-            print(" (still waiting)", end="", flush=True)
+        _tick(b". (still waiting)" if dots % 10 == 0 else b".")
+
+
+def _poll_ptt_with_dots(radio_client, ctx, want_tx: bool, waiting_label: str,
+                        err_mark: bytes, poll_max: float = 0.5) -> None:
+    """
+    Poll get_ptt() until it reads want_tx, printing a dot every ~0.5 s.
+    rigctld never pushes PTT, so this has to poll: start at 0.1 s for a snappy
+    edge right after the prompt, then grow 1.5x per poll up to poll_max.
+    """
+    now = _time.monotonic
+    poll = 0.1
+    print(f"[WAIT] {waiting_label}", end="", flush=True)
+    t = now()
+    next_dot = t + 0.5
+    next_note = t + 5.0
+    while True:
+        try:
+            if bool(radio_client.get_ptt()) == want_tx:
+                print(" detected." if want_tx else " done.")
+                return
+        except BaseRadioError as e:
+            _tick(err_mark)
+            ctx.logger.warning(f"[WAIT] radio error, retrying: {e}")
+        _time.sleep(poll)
+        poll = min(poll * 1.5, poll_max)
+        t = now()
+        if t >= next_dot:
+            next_dot = t + 0.5
+            if t >= next_note:
+                next_note = t + 5.0
+                _tick(b". (still waiting)")
+            else:
+                _tick(b".")
 
 
 def run_tuning_loop(
@@ -88,25 +130,26 @@ def run_tuning_loop(
     # Throttled status line to reduce flicker/CPU
     last_status_msg = None
     last_status_bg = None
-    last_status_ts = 0.0
+    last_status_ns = 0
+    _mono_ns = _time.monotonic_ns
 
     def status_update(msg: str, bg) -> None:
         """Only redraw status line if message/bg changed or at least 100 ms passed."""
-        nonlocal last_status_msg, last_status_bg, last_status_ts
-        now = _time.time()
-        if msg != last_status_msg or bg != last_status_bg or (now - last_status_ts) >= 0.10:
+        nonlocal last_status_msg, last_status_bg, last_status_ns
+        now = _mono_ns()
+        if msg != last_status_msg or bg != last_status_bg or (now - last_status_ns) >= 100_000_000:
             status_show(msg, bg)
             last_status_msg = msg
             last_status_bg = bg
-            last_status_ts = now
+            last_status_ns = now
 
     def status_reset() -> None:
         """Clear and reset last status cache."""
-        nonlocal last_status_msg, last_status_bg, last_status_ts
+        nonlocal last_status_msg, last_status_bg, last_status_ns
         status_clear()
         last_status_msg = None
         last_status_bg = None
-        last_status_ts = 0.0
+        last_status_ns = 0
 
     # ---------- Config ----------
     defaults = ctx.config.get("defaults", {}) if ctx and ctx.config else {}
@@ -118,7 +161,9 @@ def run_tuning_loop(
     # Time constants (configurable)
     wait_tx_timeout   = float(defaults.get("wait_tx_timeout_s", 180.0))
     wait_unkey_timeout= float(defaults.get("wait_unkey_timeout_s", 300.0))
-    event_step        = float(defaults.get("wait_step_s", 0.25))
+    # Event waits block in the client; this only bounds how often the status line
+    # is repainted (e.g. after a log line scrolled it away).
+    event_step        = float(defaults.get("wait_step_s", 5.0))
     cat_settle_s      = float(defaults.get("cat_settle_s", 0.30))
 
     # Flags derived from context/args
@@ -137,13 +182,17 @@ def run_tuning_loop(
         pts_khz = calculate_tuning_frequencies(
             b["band_start"], b["band_end"], b["segment_size"], b["first_segment_center"]
         )
-        for k in pts_khz:  # kHz → MHz
-            plan.append((band_label, round(k / 1000.0, 4)))
+        # kHz → MHz in one pass per band
+        plan.extend([(band_label, round(k / 1000.0, 4)) for k in pts_khz])
 
     if not plan:
         ctx.logger.error("[FATAL] No tuning segments computed. Check band configuration.")
         return
 
+    # Loop invariants (PTT capability flags are NOT: the client may flip them mid-run)
+    verify_enabled = amp_enabled and _should_verify_freq(ctx, rf2ks)
+    has_drive_ctl = hasattr(radio_client, "set_drive_power")
+
     # ---------- Loop ----------
     last_band: Optional[str] = None
     for band_label, freq_mhz in plan:
@@ -156,7 +205,7 @@ def run_tuning_loop(
                 if auto_set_cw_mode:
                     radio_client.set_mode("CW", 400)
                 current_drive_w = int(ctx.bands[band_label].get("drive_power", default_drive))
-                if hasattr(radio_client, "set_drive_power"):
+                if has_drive_ctl:
                     radio_client.set_drive_power(current_drive_w)
             except BaseRadioError as e:
                 ctx.logger.error(f"[RADIO] Band prep failed for {band_label}: {e}")
@@ -172,7 +221,7 @@ def run_tuning_loop(
             continue
 
         # Verify RF2K-S /data frequency (truncated kHz) if PA API is enabled
-        if amp_enabled and _should_verify_freq(ctx, rf2ks):
+        if verify_enabled:
 
             # Let the PA's controller see the CAT change
             if rf2ks.is_cat_iface():
@@ -213,21 +262,21 @@ def run_tuning_loop(
         used_auto_ptt = False
 
         # --- EVENT-DRIVEN ---
-        is_event = getattr(radio_client, "ptt_supported", True) and getattr(radio_client, "supports_event_ptt", False)
+        is_event = ptt_supported and getattr(radio_client, "supports_event_ptt", False)
         if is_event:
             if use_color_status:
                 # Wait for TX with a throttled status line
                 status_update("AUTO-PTT READY — press PTT to start carrier", BG_GREEN)
-                deadline = _time.time() + wait_tx_timeout
+                deadline = _time.monotonic() + wait_tx_timeout
                 got_tx = False
-                while _time.time() < deadline:
-                    if radio_client.wait_for_tx(timeout=min(event_step, max(0.05, wait_tx_timeout))):
+                while (left := deadline - _time.monotonic()) > 0:
+                    if radio_client.wait_for_tx(timeout=min(event_step, max(0.05, left))):
                         got_tx = True
                         break
                     status_update("AUTO-PTT READY — press PTT to start carrier", BG_GREEN)
 
-                status_reset()
                 if not got_tx:
+                    status_reset()
                     ctx.logger.warning("[WAIT] Timeout waiting for carrier (event-driven). Skipping segment.")
                     continue
 
@@ -237,16 +286,18 @@ def run_tuning_loop(
                     (guidance_mode == "once_per_band" and band_label not in _guidance_shown_once)
                 )
                 if show_verbose:
+                    status_reset()
                     print("\n[PTT] Carrier detected — radio is transmitting.")
                     print(f"       → Tune your {AMPLIFIER_NAME} now.")
                     print(f"       → Keep transmitting! **AFTER** you finish tuning your {AMPLIFIER_NAME}, unkey (stop transmitting).")
                     _guidance_shown_once.add(band_label)
 
-                # Wait for UNKEY with a throttled status line
+                # Wait for UNKEY with a throttled status line. Without guidance in
+                # between, the padded red line overwrites the green one in place.
                 status_update("TX ACTIVE — tune & store, then UNKEY", BG_RED)
-                deadline2 = _time.time() + wait_unkey_timeout
-                while _time.time() < deadline2:
-                    if radio_client.wait_for_unkey(timeout=min(event_step, max(0.05, wait_unkey_timeout))):
+                deadline2 = _time.monotonic() + wait_unkey_timeout
+                while (left := deadline2 - _time.monotonic()) > 0:
+                    if radio_client.wait_for_unkey(timeout=min(event_step, max(0.05, left))):
                         used_auto_ptt = True
                         break
                     status_update("TX ACTIVE — tune & store, then UNKEY", BG_RED)
@@ -288,42 +339,16 @@ def run_tuning_loop(
 
         # --- POLLING (get_ptt) ---
         else:
-            poll = 0.25
-            print("[WAIT] Waiting for carrier", end="", flush=True)
-            dots = 0
-            while True:
-                try:
-                    if radio_client.get_ptt():
-                        print(" detected.")
-                        break
-                except BaseRadioError as e:
-                    print(" x", end="", flush=True)
-                    ctx.logger.warning(f"[WAIT] radio error, retrying: {e}")
-                _time.sleep(poll)
-                print(".", end="", flush=True)
-                dots += 1
-                if dots % int(max(1, round(5.0 / poll))) == 0:
-                    print(" (still waiting)", end="", flush=True)
+            _poll_ptt_with_dots(radio_client, ctx, want_tx=True,
+                                waiting_label="Waiting for carrier", err_mark=b" x")
 
             print("\n[PTT] Carrier detected — radio is transmitting.")
             print(f"       → Tune your {AMPLIFIER_NAME} now.")
             print(f"       → Keep transmitting! **AFTER** you finish tuning your {AMPLIFIER_NAME}, unkey (stop transmitting).")
 
-            print("[WAIT] Still transmitting", end="", flush=True)
-            dots = 0
-            while True:
-                try:
-                    if not radio_client.get_ptt():
-                        print(" done.")
-                        break
-                except BaseRadioError as e:
-                    print(" ?", end="", flush=True)
-                    ctx.logger.warning(f"[WAIT] radio error, retrying: {e}")
-                _time.sleep(poll)
-                print(".", end="", flush=True)
-                dots += 1
-                if dots % int(max(1, round(5.0 / poll))) == 0:
-                    print(" (still waiting)", end="", flush=True)
+            _poll_ptt_with_dots(radio_client, ctx, want_tx=False,
+                                waiting_label="Still transmitting", err_mark=b" ?",
+                                poll_max=1.0)
             print("\n[PTT] Carrier stopped.")
             used_auto_ptt = True
 
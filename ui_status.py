@@ -22,23 +22,33 @@ _status_width = 0
 # Allow turning colors off via env (useful for CI or legacy consoles)
 _DISABLE_COLOR = os.getenv("NO_ANSI") == "1"
 
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+# Resolved on first draw; stdout does not change from tty to pipe mid-run
+_COLOR_ENABLED: Optional[bool] = None
+_SUFFIX = f" {RESET}"
+_SPACES = " " * 256  # padding source; wider lines fall back to " " * n
+
 def _strip_ansi(s: str) -> str:
     """Strip ANSI sequences to compute printable width."""
-    return re.sub(r"\x1b\[[0-9;]*m", "", s)
+    return _ANSI_RE.sub("", s)
 
-def _pad(s: str, width: int) -> str:
+def _pad(s: str, width: int, raw_len: Optional[int] = None) -> str:
     """Right-pad with spaces so we fully overwrite older content."""
-    raw_len = len(_strip_ansi(s))
-    if raw_len < width:
-        return s + (" " * (width - raw_len))
-    return s
+    if raw_len is None:
+        raw_len = len(_strip_ansi(s))
+    pad_n = width - raw_len
+    if pad_n <= 0:
+        return s
+    return s + (_SPACES[:pad_n] if pad_n <= len(_SPACES) else " " * pad_n)
 
 def _supports_color() -> bool:
     """Best-effort check; allow force-disable via NO_ANSI=1."""
-    if _DISABLE_COLOR:
-        return False
-    # On Windows 10/11 modern terminals support ANSI; fall back to plain if redirected
-    return sys.stdout.isatty()
+    global _COLOR_ENABLED
+    if _COLOR_ENABLED is None:
+        # On Windows 10/11 modern terminals support ANSI; fall back to plain if redirected
+        _COLOR_ENABLED = (not _DISABLE_COLOR) and sys.stdout.isatty()
+    return _COLOR_ENABLED
 
 def status_show(text: str, bg_color: str) -> None:
     """
@@ -49,17 +59,22 @@ def status_show(text: str, bg_color: str) -> None:
     """
     global _status_active, _status_width
     if _supports_color():
-        msg = f"{bg_color}{BOLD} {text} {RESET}"
+        msg = f"{bg_color}{BOLD} {text}{_SUFFIX}"
     else:
         # Plain fallback without ANSI (keeps the UX semantics)
         msg = f" {text} "
-    _status_width = max(_status_width, len(_strip_ansi(msg)))
-    print("\r" + _pad(msg, _status_width), end="", flush=True)
+    # Printable width is known without scanning: ' text ' either way.
+    raw_len = len(text) + 2
+    _status_width = max(_status_width, raw_len)
+    # One write + flush: CR and the padded line overwrite the old status in place
+    sys.stdout.write("\r" + _pad(msg, _status_width, raw_len))
+    sys.stdout.flush()
     _status_active = True
 
 def status_clear() -> None:
     """Erase the status line in-place without clearing the rest of the screen."""
     global _status_active, _status_width
     if _status_active:
-        print("\r" + (" " * _status_width) + "\r", end="", flush=True)
+        sys.stdout.write("\r" + (" " * _status_width) + "\r")
+        sys.stdout.flush()
         _status_active = False
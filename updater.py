@@ -17,7 +17,7 @@ or run `python -m updater --version 0.9.313 --interactive`.
 
 from __future__ import annotations
 
-import ctypes
+import hashlib
 import json
 import os
 import re
@@ -25,12 +25,18 @@ import subprocess
 import sys
 import tempfile
 import time
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
+from urllib.error import HTTPError
 from urllib.request import Request, urlopen, URLError
 
-ENGINE_TAG = "r9"  # bump when logic changes (printed to console)
+ENGINE_TAG = "r10"  # bump when logic changes (printed to console)
+
+_VERSION_SPLIT_RE = re.compile(r"[^\d]+")
+_SETUP_ASSET_RE = re.compile(r"^RF2K-TRAINER_.*_Setup\.exe$", re.IGNORECASE)
+_YES_ANSWERS = frozenset({"y", "yes", "j", "ja", "true", "1"})
 
 # ------------------------------ Model ---------------------------------
 
@@ -41,6 +47,7 @@ class ReleaseInfo:
     version: str          # e.g. "0.9.312"
     download_url: str     # browser_download_url for RF2K-TRAINER_*_Setup.exe
     name: str             # asset filename
+    digest: str = ""      # "sha256:<hex>" from the release asset, if GitHub provides it
 
 
 # ------------------------------ Public API ----------------------------
@@ -111,6 +118,12 @@ def check_for_updates(current_version: str,
     if not download(rel.download_url, dest):
         print("[update] download failed.")
         return
+    if not verify_download(dest, rel):
+        try:
+            dest.unlink()
+        except OSError:
+            pass
+        return
 
     # Build inno arguments
     log_path = temp_dir / "RF2K-TRAINER_update.log"
@@ -118,8 +131,8 @@ def check_for_updates(current_version: str,
         "/VERYSILENT",
         "/NORESTART",
         "/SP-",
-        f"/LOG={str(log_path)}",
-        f"/DIR={str(install_dir)}",
+        "/LOG=" + os.fspath(log_path),
+        "/DIR=" + os.fspath(install_dir),
     ]
     if not is_machine:
         args_list.append("/CURRENTUSER")
@@ -136,8 +149,11 @@ def check_for_updates(current_version: str,
         print(f"[update] installer started (per-user). Log: {log_path}")
 
     # Create a sentinel file so the batch launcher can close even if exit code gets lost.
+    # Written to a temp name and renamed so the launcher never sees a partial file.
     try:
-        Path("rf2k-update.flag").write_text("111", encoding="utf-8")
+        tmp = Path("rf2k-update.flag.tmp")
+        tmp.write_text("111", encoding="utf-8")
+        os.replace(tmp, "rf2k-update.flag")
     except Exception:
         pass
 
@@ -165,7 +181,7 @@ def normalize_version(v: str) -> str:
     if v.lower().startswith("v"):
         v = v[1:]
     # allow X.Y or X.Y.Z; pad to three parts
-    parts = re.split(r"[^\d]+", v)
+    parts = _VERSION_SPLIT_RE.split(v)
     parts = [p for p in parts if p.isdigit()]
     if not parts:
         return ""
@@ -174,9 +190,21 @@ def normalize_version(v: str) -> str:
     return ".".join(parts[:3])
 
 
+def _fast_parse(v: str) -> Optional[Tuple[int, int, int]]:
+    """Plain 'X.Y' / 'X.Y.Z' (optional leading v/V) without regex; None otherwise."""
+    s = v[1:] if v[:1] in ("v", "V") else v
+    parts = s.split(".")
+    if len(parts) not in (2, 3) or not all(p.isdecimal() for p in parts):
+        return None
+    return int(parts[0]), int(parts[1]), int(parts[2]) if len(parts) == 3 else 0
+
+
 def compare_versions(a: str, b: str) -> int:
     """-1 if a<b, 0 if a==b, +1 if a>b (semantic compare)."""
     def parse(x: str) -> Tuple[int, int, int]:
+        fast = _fast_parse(x)
+        if fast is not None:
+            return fast
         n = normalize_version(x)
         major, minor, patch = (int(p) for p in n.split("."))
         return major, minor, patch
@@ -186,18 +214,38 @@ def compare_versions(a: str, b: str) -> int:
 
 
 def fetch_latest_release() -> Optional[ReleaseInfo]:
-    """Call GitHub API for latest release and pick the Setup.exe asset."""
+    """
+    Call GitHub API for latest release and pick the Setup.exe asset.
+
+    The last good answer is cached with its ETag/Last-Modified; a conditional
+    request that comes back 304 returns the cached release without a body.
+    """
+    headers = {
+        "User-Agent": "rf2k-trainer-updater",
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+    cached = _load_release_cache()
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
     req = Request(
         "https://api.github.com/repos/tnxqso/rf2k-trainer/releases/latest",
-        headers={
-            "User-Agent": "rf2k-trainer-updater",
-            "Accept": "application/vnd.github+json",
-            "X-GitHub-Api-Version": "2022-11-28",
-        },
-    )   
+        headers=headers,
+    )
     try:
         with urlopen(req, timeout=15) as r:
+            etag = r.headers.get("ETag")
+            last_modified = r.headers.get("Last-Modified")
             data = json.loads(r.read().decode("utf-8", "replace"))
+    except HTTPError as e:
+        if e.code == 304 and cached:
+            return ReleaseInfo(**cached["release"])
+        print(f"[update] failed to query GitHub: {e}")
+        return None
     except URLError as e:
         print(f"[update] failed to query GitHub: {e}")
         return None
@@ -214,7 +262,7 @@ def fetch_latest_release() -> Optional[ReleaseInfo]:
     setup = None
     for a in assets:
         name = a.get("name") or ""
-        if re.match(r"^RF2K-TRAINER_.*_Setup\.exe$", name, re.I):
+        if _SETUP_ASSET_RE.match(name):
             setup = a
             break
     if not setup:
@@ -227,21 +275,61 @@ def fetch_latest_release() -> Optional[ReleaseInfo]:
         return None
 
     version = normalize_version(tag)
-    return ReleaseInfo(tag=tag, version=version, download_url=dl, name=setup.get("name", ""))
+    rel = ReleaseInfo(tag=tag, version=version, download_url=dl, name=setup.get("name", ""),
+                      digest=str(setup.get("digest") or ""))
+    _store_release_cache(etag, last_modified, rel)
+    return rel
+
+
+def _release_cache_path() -> Path:
+    local = Path(os.environ.get("LOCALAPPDATA", str(Path.home() / "AppData/Local")))
+    return local / "rf2k-trainer" / "release_cache.json"  # same per-user dir as the rigctl model cache
+
+
+def _load_release_cache() -> Optional[dict]:
+    """Return {etag, last_modified, release} from the last good query, or None."""
+    try:
+        with open(_release_cache_path(), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        ReleaseInfo(**data["release"])  # validate shape before trusting it for a 304
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if not (data.get("etag") or data.get("last_modified")):
+        return None
+    return data
+
+
+def _store_release_cache(etag: Optional[str], last_modified: Optional[str], rel: ReleaseInfo) -> None:
+    """Best-effort write; a failure only costs a full response next time."""
+    if not (etag or last_modified):
+        return
+    path = _release_cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"etag": etag, "last_modified": last_modified, "release": asdict(rel)}, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
 
 
+@lru_cache(maxsize=1)
 def detect_install_dir_and_scope() -> Tuple[Path, bool]:
     r"""
     Return (install_dir, is_machine).
     - If current exe lives under Program Files -> machine-wide (True)
     - Else -> %LOCALAPPDATA%\Programs\RF2K-TRAINER (per-user, False)
+
+    Cached: the answer cannot change within a process. resolve() is kept on
+    purpose so 8.3 short names and junctions still match the Program Files prefix.
     """
     exe_path = Path(sys.executable if getattr(sys, "frozen", False) else sys.argv[0]).resolve()
     lower = str(exe_path).lower()
     pf = os.environ.get("ProgramFiles", r"C:\Program Files").lower()
     pf86 = os.environ.get("ProgramFiles(x86)", r"C:\Program Files (x86)").lower()
 
-    if lower.startswith(pf) or lower.startswith(pf86):
+    if lower.startswith((pf, pf86)):
         inst_dir = Path(os.environ.get("ProgramFiles", r"C:\Program Files")) / "RF2K-TRAINER"
         return inst_dir, True
 
@@ -257,25 +345,90 @@ def prompt_yes_no(msg: str, default: bool = True) -> bool:
         return False
     if not ans:
         return default
-    return ans in ("y", "yes", "j", "ja", "true", "1")
+    return ans in _YES_ANSWERS
 
 
 def download(url: str, dest: Path) -> bool:
     try:
         req = Request(url, headers={"User-Agent": "rf2k-trainer-updater"})
         with urlopen(req, timeout=60) as r, open(dest, "wb") as f:
-            # Stream to disk
+            try:
+                size = int(r.headers.get("Content-Length") or 0)
+            except ValueError:
+                size = 0
+            if size > 0:
+                f.truncate(size)  # reserve the whole file up front (less fragmentation)
+
+            # Stream to disk through one reused 1 MiB buffer
+            buf = bytearray(1 << 20)
+            view = memoryview(buf)
+            done = 0
+            next_report = 10 << 20
             while True:
-                chunk = r.read(64 * 1024)
-                if not chunk:
+                n = r.readinto(buf)
+                if not n:
                     break
-                f.write(chunk)
+                done += f.write(view[:n])  # buffered write: always consumes all n bytes
+                if done >= next_report:
+                    print(f"[update] {done >> 20} MiB" + (f" / {size >> 20} MiB" if size else ""))
+                    next_report += 10 << 20
+
+        # With a pre-sized file a short read would otherwise look complete
+        if size and done != size:
+            print(f"[update] download incomplete: {done} of {size} bytes")
+            return False
         return True
     except Exception as e:
         print(f"[update] download error: {e}")
         return False
 
 
+def _expected_sha256(rel: ReleaseInfo) -> str:
+    """Hex SHA-256 from the asset digest, else from a '<asset>.sha256' sidecar; '' if neither."""
+    algo, _, value = rel.digest.partition(":")
+    if algo.lower() == "sha256" and value:
+        return value.strip().lower()
+    try:
+        req = Request(rel.download_url + ".sha256", headers={"User-Agent": "rf2k-trainer-updater"})
+        with urlopen(req, timeout=15) as r:
+            text = r.read(4096).decode("ascii", "replace")
+    except Exception:
+        return ""
+    parts = text.split()  # "<hex>  <filename>" (sha256sum format) or just "<hex>"
+    token = parts[0].lower() if parts else ""
+    return token if len(token) == 64 and all(c in "0123456789abcdef" for c in token) else ""
+
+
+def verify_download(dest: Path, rel: ReleaseInfo) -> bool:
+    """
+    Check the downloaded installer against the published SHA-256 before it is run.
+    Returns False on a mismatch or if the file cannot be read; releases without
+    any digest are accepted.
+    """
+    expected = _expected_sha256(rel)
+    if not expected:
+        print("[update] no SHA-256 published for this release; skipping integrity check.")
+        return True
+    try:
+        with open(dest, "rb") as f:
+            file_digest = getattr(hashlib, "file_digest", None)  # Python 3.11+
+            if file_digest is not None:
+                got = file_digest(f, "sha256").hexdigest()
+            else:
+                h = hashlib.sha256()
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    h.update(chunk)
+                got = h.hexdigest()
+    except OSError as e:
+        print(f"[update] could not read installer for verification: {e}")
+        return False
+    if got != expected:
+        print(f"[update] installer checksum mismatch (expected {expected}, got {got}); not running it.")
+        return False
+    print("[update] installer SHA-256 verified.")
+    return True
+
+
 def start_installer(installer: Path, args: list[str], elevate: bool) -> bool:
     """
     Start the Inno Setup installer.
@@ -286,20 +439,48 @@ def start_installer(installer: Path, args: list[str], elevate: bool) -> bool:
         if elevate:
             # Build a single command-line string for ShellExecute
             arg_str = " ".join(_quote_if_needed(a) for a in args)
-            # ShellExecuteW returns >32 on success
-            rc = ctypes.windll.shell32.ShellExecuteW(
+            # ShellExecuteW returns an HINSTANCE >32 on success
+            rc = _shell_execute_w()(
                 None, "runas", str(installer), arg_str, None, 1
             )
-            return rc > 32
+            return (rc or 0) > 32
         else:
-            # Start detached; no need to wait
-            subprocess.Popen([str(installer), *args], close_fds=False)
+            # Start fully detached (no console, no inherited handles) so nothing
+            # ties the installer to this process when we os._exit(111) below.
+            flags = (getattr(subprocess, "DETACHED_PROCESS", 0x00000008)
+                     | getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0x00000200))
+            subprocess.Popen(
+                [str(installer), *args],
+                close_fds=True,
+                creationflags=flags,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
             return True
     except Exception as e:
         print(f"[update] start error: {e}")
         return False
 
 
+_ShellExecuteW = None
+
+
+def _shell_execute_w():
+    """ShellExecuteW with an explicit prototype, bound on first use (not on import)."""
+    global _ShellExecuteW
+    if _ShellExecuteW is None:
+        import ctypes
+        from ctypes import wintypes
+        # Own WinDLL handle so we don't retype the shared ctypes.windll.shell32 entry
+        fn = ctypes.WinDLL("shell32").ShellExecuteW
+        fn.argtypes = [wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR,
+                       wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_int]
+        fn.restype = wintypes.HINSTANCE  # pointer-sized; no int truncation on 64-bit
+        _ShellExecuteW = fn
+    return _ShellExecuteW
+
+
 def _quote_if_needed(s: str) -> str:
     # Quote only when spaces exist; keep tokens like /LOG=C:\path intact
     if " " in s or "\t" in s:
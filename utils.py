@@ -2,7 +2,10 @@
 # Small user-interface helpers and formatting utilities.
 
 from __future__ import annotations
+import math
 import platform
+import sys
+import time
 
 def pretty_duration(seconds: float, style: str = "auto") -> str:
     """Format duration as '1h 02m 05s' / '22m 03s' / '3.40 s' / '850 ms' or 'HH:MM:SS'."""
@@ -10,10 +13,8 @@ def pretty_duration(seconds: float, style: str = "auto") -> str:
         seconds = 0.0
 
     if style == "clock":
-        total = int(round(seconds))
-        h = total // 3600
-        m = (total % 3600) // 60
-        s = total % 60
+        h, rem = divmod(int(round(seconds)), 3600)
+        m, s = divmod(rem, 60)
         return f"{h:02d}:{m:02d}:{s:02d}"
 
     if seconds < 0.001:
@@ -23,10 +24,8 @@ def pretty_duration(seconds: float, style: str = "auto") -> str:
     if seconds < 60.0:
         return f"{seconds:.2f} s"
 
-    total = int(round(seconds))
-    h = total // 3600
-    m = (total % 3600) // 60
-    s = total % 60
+    h, rem = divmod(int(round(seconds)), 3600)
+    m, s = divmod(rem, 60)
 
     if h > 0:
         return f"{h}h {m}m {s:02d}s"
@@ -49,11 +48,16 @@ def beep(enabled: bool = True) -> None:
 
 def countdown(seconds: int, message: str = "    →  Tuning next frequency") -> None:
     """Simple countdown helper if we ever want a short delay between steps."""
-    import sys, time
-    for i in range(seconds, 0, -1):
-        sys.stdout.write(f"{message} in {i} second(s)...\r")
-        sys.stdout.flush()
-        time.sleep(1)
+    deadline = time.monotonic() + seconds
+    shown = None
+    while (remaining := deadline - time.monotonic()) > 0:
+        i = math.ceil(remaining)
+        if i != shown:
+            sys.stdout.write(f"{message} in {i} second(s)...\r")
+            sys.stdout.flush()
+            shown = i
+        # Short slices off a monotonic deadline: no cumulative sleep(1) drift
+        time.sleep(min(0.25, remaining))
     sys.stdout.write(" " * 80 + "\r")
     sys.stdout.flush()
     print()